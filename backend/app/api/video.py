@@ -27,6 +27,11 @@ os.makedirs(f"{settings.UPLOAD_DIR}/bgm", exist_ok=True)
 os.makedirs(f"{settings.UPLOAD_DIR}/videos", exist_ok=True)
 os.makedirs(f"{settings.UPLOAD_DIR}/images", exist_ok=True)
 
+# 上传文件允许的扩展名（模块加载时构建，避免每次请求重建集合）
+_AUDIO_UPLOAD_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".ogg"})
+_IMAGE_UPLOAD_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".gif"})
+_VIDEO_UPLOAD_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm"})
+
 
 class VideoTaskCreate(BaseModel):
     """创建视频任务请求 (Requirements 9.1)"""
@@ -674,7 +679,7 @@ async def get_task_status(task_id: str, db: Session = Depends(get_db)):
     - error_message: 错误信息（仅失败状态）
     """
     from app.services.video_service import (
-        build_task_status_response,
+        build_task_status_dict,
         TASK_STATUS_PENDING,
         TASK_STATUS_PROCESSING,
         TASK_STATUS_COMPLETED,
@@ -690,7 +695,7 @@ async def get_task_status(task_id: str, db: Session = Depends(get_db)):
     
     # 如果已完成，返回完整状态信息 (Requirements 8.5)
     if task_db.status == TASK_STATUS_COMPLETED:
-        response = build_task_status_response(
+        return build_task_status_dict(
             status_code=TASK_STATUS_COMPLETED,
             progress=100,
             progress_message="视频生成完成",
@@ -698,43 +703,39 @@ async def get_task_status(task_id: str, db: Session = Depends(get_db)):
             duration=task_db.output_duration,
             task_id=task_id
         )
-        return response.to_dict()
     
     # 如果失败，返回错误信息 (Requirements 8.6)
     if task_db.status == TASK_STATUS_FAILED:
-        response = build_task_status_response(
+        return build_task_status_dict(
             status_code=TASK_STATUS_FAILED,
             progress=0,
             progress_message=task_db.error_message or "视频生成失败",
             error_message=task_db.error_message or "视频生成失败",
             task_id=task_id
         )
-        return response.to_dict()
     
     # 从 Celery 获取任务状态
     if task_db.celery_task_id:
         celery_result = AsyncResult(task_db.celery_task_id, app=celery_app)
         
         if celery_result.state == 'PENDING':
-            response = build_task_status_response(
+            return build_task_status_dict(
                 status_code=TASK_STATUS_PENDING,
                 progress=task_db.progress or 5,
                 progress_message=task_db.progress_message or "任务排队中...",
                 task_id=task_id
             )
-            return response.to_dict()
         elif celery_result.state == 'PROCESSING':
             info = celery_result.info or {}
-            response = build_task_status_response(
+            return build_task_status_dict(
                 status_code=TASK_STATUS_PROCESSING,
                 progress=info.get('progress', task_db.progress or 30),
                 progress_message=info.get('message', task_db.progress_message or "正在处理..."),
                 task_id=task_id
             )
-            return response.to_dict()
         elif celery_result.state == 'SUCCESS':
             result = celery_result.result or {}
-            response = build_task_status_response(
+            return build_task_status_dict(
                 status_code=TASK_STATUS_COMPLETED,
                 progress=100,
                 progress_message=result.get('message', '视频生成完成'),
@@ -742,26 +743,23 @@ async def get_task_status(task_id: str, db: Session = Depends(get_db)):
                 duration=result.get('duration'),
                 task_id=task_id
             )
-            return response.to_dict()
         elif celery_result.state == 'FAILURE':
             error_msg = str(celery_result.info) if celery_result.info else '视频生成失败'
-            response = build_task_status_response(
+            return build_task_status_dict(
                 status_code=TASK_STATUS_FAILED,
                 progress=0,
                 progress_message=error_msg,
                 error_message=error_msg,
                 task_id=task_id
             )
-            return response.to_dict()
     
     # 默认返回数据库中的进度 (Requirements 8.3)
-    response = build_task_status_response(
+    return build_task_status_dict(
         status_code=task_db.status,
         progress=task_db.progress or 0,
         progress_message=task_db.progress_message or "等待处理...",
         task_id=task_id
     )
-    return response.to_dict()
 
 
 @router.get("/{task_id}/download")
@@ -793,9 +791,8 @@ async def upload_bgm(
 ):
     """上传背景音乐"""
     # 验证文件格式
-    allowed_ext = {".mp3", ".wav", ".m4a", ".ogg"}
     ext = os.path.splitext(file.filename)[1].lower()
-    if ext not in allowed_ext:
+    if ext not in _AUDIO_UPLOAD_EXTENSIONS:
         raise HTTPException(status_code=400, detail=f"不支持的格式: {ext}")
     
     # 验证文件大小 (最大 20MB)
@@ -823,9 +820,8 @@ async def upload_voice(
 ):
     """上传自定义配音"""
     # 验证文件格式
-    allowed_ext = {".mp3", ".wav", ".m4a", ".ogg"}
     ext = os.path.splitext(file.filename)[1].lower()
-    if ext not in allowed_ext:
+    if ext not in _AUDIO_UPLOAD_EXTENSIONS:
         raise HTTPException(status_code=400, detail=f"不支持的格式: {ext}")
     
     # 验证文件大小 (最大 50MB)
@@ -857,9 +853,8 @@ async def upload_image(
 ):
     """上传图片素材"""
     # 验证文件格式
-    allowed_ext = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
     ext = os.path.splitext(file.filename)[1].lower()
-    if ext not in allowed_ext:
+    if ext not in _IMAGE_UPLOAD_EXTENSIONS:
         raise HTTPException(status_code=400, detail=f"不支持的格式: {ext}")
     
     # 验证文件大小 (最大 10MB)
@@ -889,12 +884,11 @@ async def upload_images(
     user: User = Depends(get_current_user)
 ):
     """批量上传图片素材"""
-    allowed_ext = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
     results = []
     
     for file in files:
         ext = os.path.splitext(file.filename)[1].lower()
-        if ext not in allowed_ext:
+        if ext not in _IMAGE_UPLOAD_EXTENSIONS:
             continue
         
         content = await file.read()
@@ -955,13 +949,12 @@ async def upload_videos(
     user: User = Depends(get_current_user)
 ):
     """批量上传视频素材（最大 150MB/个）"""
-    allowed_ext = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
     results = []
     max_size = 150 * 1024 * 1024  # 150MB
     
     for file in files:
         ext = os.path.splitext(file.filename)[1].lower()
-        if ext not in allowed_ext:
+        if ext not in _VIDEO_UPLOAD_EXTENSIONS:
             continue
         
         content = await file.read()
@@ -8,43 +8,48 @@ def check_and_deduct_quota(db: Session, user_id: int, service_code: str, task_id
     检查并扣除配额
     返回扣除的配额类型: 'free' 或 'paid'
     """
-    # 获取服务
-    service = db.query(Service).filter(Service.code == service_code, Service.status == 1).first()
-    if not service:
-        raise HTTPException(status_code=400, detail=f"服务 {service_code} 不可用")
-    
-    # 获取用户配额
-    quota = db.query(UserServiceQuota).filter(
-        UserServiceQuota.user_id == user_id,
-        UserServiceQuota.service_id == service.id
-    ).first()
-    
-    if not quota:
-        raise HTTPException(status_code=403, detail="配额不足，请充值")
-    
-    amount = service.quota_per_call
-    quota_type = None
-    
-    # 优先扣免费配额
-    if quota.free_quota >= amount:
-        quota.free_quota -= amount
-        quota_type = "free"
-    elif quota.paid_quota >= amount:
-        quota.paid_quota -= amount
-        quota_type = "paid"
-    else:
-        raise HTTPException(status_code=403, detail="配额不足，请充值")
-    
-    # 记录配额消耗
-    log = QuotaLog(
-        user_id=user_id,
-        service_id=service.id,
-        task_id=task_id,
-        quota_type=quota_type,
-        amount=amount
-    )
-    db.add(log)
-    db.commit()
+    # 整个检查与扣减在同一事务内完成：成功时提交，任何异常（包括配额不足）都立即回滚，
+    # 避免会话停留在未结束的事务中
+    try:
+        # 获取服务
+        service = db.query(Service).filter(Service.code == service_code, Service.status == 1).first()
+        if not service:
+            raise HTTPException(status_code=400, detail=f"服务 {service_code} 不可用")
+        
+        amount = service.quota_per_call
+        quota_query = db.query(UserServiceQuota).filter(
+            UserServiceQuota.user_id == user_id,
+            UserServiceQuota.service_id == service.id
+        )
+        
+        # 原子条件扣减（UPDATE ... WHERE quota >= amount），并发请求无需先加锁读取，
+        # 余额不足时更新行数为 0，不会出现超扣
+        # 优先扣免费配额
+        if quota_query.filter(UserServiceQuota.free_quota >= amount).update(
+            {UserServiceQuota.free_quota: UserServiceQuota.free_quota - amount}
+        ):
+            quota_type = "free"
+        elif quota_query.filter(UserServiceQuota.paid_quota >= amount).update(
+            {UserServiceQuota.paid_quota: UserServiceQuota.paid_quota - amount}
+        ):
+            quota_type = "paid"
+        else:
+            # 无配额记录或余额不足
+            raise HTTPException(status_code=403, detail="配额不足，请充值")
+        
+        # 记录配额消耗
+        log = QuotaLog(
+            user_id=user_id,
+            service_id=service.id,
+            task_id=task_id,
+            quota_type=quota_type,
+            amount=amount
+        )
+        db.add(log)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     
     return quota_type
 
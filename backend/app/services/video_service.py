@@ -1,18 +1,37 @@
 """视频混剪服务"""
+import functools
+import json
 import os
 import re
-from typing import List, Dict, Optional, Tuple
-
-# 兼容 Pillow 10+ (ANTIALIAS 被移除，改用 LANCZOS)
-from PIL import Image
-if not hasattr(Image, 'ANTIALIAS'):
-    Image.ANTIALIAS = Image.Resampling.LANCZOS
-
-from moviepy.editor import (
-    VideoFileClip, AudioFileClip, ImageClip, TextClip, ColorClip,
-    CompositeVideoClip, CompositeAudioClip, concatenate_videoclips,
-    vfx, afx
-)
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+
+# moviepy / Pillow 导入开销较大，统一在渲染函数内按需导入，
+# 校验函数和配置常量无需加载这些依赖
+if TYPE_CHECKING:
+    from moviepy.editor import TextClip
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_pil_compat() -> None:
+    """兼容 Pillow 10+ (ANTIALIAS 被移除，改用 LANCZOS)，moviepy 的 resize 依赖该属性"""
+    from PIL import Image
+    if not hasattr(Image, 'ANTIALIAS'):
+        Image.ANTIALIAS = Image.Resampling.LANCZOS
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cv2():
+    """按需导入 OpenCV（可选依赖，逐帧缩放/滤镜更快），未安装时返回 None，调用方回退到 Pillow/NumPy"""
+    try:
+        import cv2
+    except ImportError:
+        return None
+    return cv2
 
 
 # ============================================================
@@ -38,8 +57,15 @@ VIDEO_LAYOUTS = {
     "21:9": {"name": "宽银幕", "ratio": (21, 9)},
 }
 
+# 分辨率/布局键集合及有序键元组（模块加载时预计算，供成员校验和错误信息使用）
+_VIDEO_RESOLUTION_KEYS = frozenset(VIDEO_RESOLUTIONS)
+_VIDEO_RESOLUTION_KEY_LIST = tuple(VIDEO_RESOLUTIONS)
+_VIDEO_LAYOUT_KEYS = frozenset(VIDEO_LAYOUTS)
+_VIDEO_LAYOUT_KEY_LIST = tuple(VIDEO_LAYOUTS)
+
 # 帧率选项 (Requirements 5.3)
 FRAME_RATES = [24, 25, 30, 50, 60]
+_FRAME_RATE_SET = frozenset(FRAME_RATES)
 
 # 平台预设配置 (Requirements 5.4)
 PLATFORM_PRESETS = {
@@ -68,6 +94,10 @@ TRANSITIONS = {
     "wipe_right": {"name": "右擦除", "duration": 0.5},
 }
 
+# 转场类型键集合（模块加载时预计算，校验时不再临时构建列表）
+_TRANSITION_KEYS = frozenset(TRANSITIONS)
+_TRANSITION_KEY_LIST = tuple(TRANSITIONS)
+
 # 转场时长范围配置 (Requirements 6.5)
 TRANSITION_DURATION_MIN = 0.3  # 最小转场时长（秒）
 TRANSITION_DURATION_MAX = 2.0  # 最大转场时长（秒）
@@ -80,6 +110,9 @@ FIT_MODES = {
     "stretch": "拉伸填充",
 }
 
+_FIT_MODE_KEYS = frozenset(FIT_MODES)
+_FIT_MODE_KEY_LIST = tuple(FIT_MODES)
+
 # 颜色滤镜 (Requirements 10.2)
 COLOR_FILTERS = {
     "none": "原始",
@@ -91,6 +124,9 @@ COLOR_FILTERS = {
     "soft": "柔和",
 }
 
+_COLOR_FILTER_KEYS = frozenset(COLOR_FILTERS)
+_COLOR_FILTER_KEY_LIST = tuple(COLOR_FILTERS)
+
 # 视频特效类型 (Requirements 10.1)
 EFFECT_TYPES = {
     "none": "无特效",
@@ -105,6 +141,9 @@ EFFECT_TYPES = {
     "pan_down": "下平移",
 }
 
+_EFFECT_TYPE_KEYS = frozenset(EFFECT_TYPES)
+_EFFECT_TYPE_KEY_LIST = tuple(EFFECT_TYPES)
+
 # 视频调节参数范围 (Requirements 10.3)
 BRIGHTNESS_MIN = 0.5
 BRIGHTNESS_MAX = 2.0
@@ -152,6 +191,7 @@ SUBTITLE_STROKE_WIDTH_DEFAULT = 2.0  # 字幕描边宽度默认值
 
 SUBTITLE_POSITIONS = ["top", "center", "bottom", "top_left", "top_right", "left", "right", "bottom_left", "bottom_right"]  # 支持的字幕位置
 SUBTITLE_POSITION_DEFAULT = "bottom"  # 默认字幕位置
+_SUBTITLE_POSITION_SET = frozenset(SUBTITLE_POSITIONS)
 
 SUBTITLE_FONT_DEFAULT = "Heiti-SC-Medium"  # 默认字幕字体
 SUBTITLE_COLOR_DEFAULT = "#FFFFFF"  # 默认字幕颜色
@@ -160,6 +200,7 @@ SUBTITLE_STROKE_COLOR_DEFAULT = "#000000"  # 默认字幕描边颜色
 # 输出质量配置 (Requirements 6.10)
 OUTPUT_QUALITIES = ["low", "medium", "high", "ultra"]  # 支持的输出质量
 OUTPUT_QUALITY_DEFAULT = "high"  # 默认输出质量
+_OUTPUT_QUALITY_SET = frozenset(OUTPUT_QUALITIES)
 
 # 视频帧率默认值 (Requirements 5.3)
 VIDEO_FPS_DEFAULT = 30  # 默认帧率
@@ -188,6 +229,7 @@ VIDEO_SIZES = {
     "1080p": {"portrait": (1080, 1920), "landscape": (1920, 1080)},
     "4k": {"portrait": (2160, 3840), "landscape": (3840, 2160)},
 }
+_DEFAULT_VIDEO_SIZE_ENTRY = VIDEO_SIZES["1080p"]
 
 # 支持的视频格式 (Requirements 3.1)
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
@@ -195,6 +237,12 @@ ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm"}
 # 支持的图片格式 (Requirements 3.2)
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
 
+# 扩展名 -> 媒体类型映射
+EXT_TO_TYPE = {
+    **{ext: "video" for ext in ALLOWED_VIDEO_EXTENSIONS},
+    **{ext: "image" for ext in ALLOWED_IMAGE_EXTENSIONS},
+}
+
 # 文件大小限制 (Requirements 3.3, 3.4)
 MAX_VIDEO_FILE_SIZE = 150 * 1024 * 1024  # 150MB
 MAX_IMAGE_FILE_SIZE = 10 * 1024 * 1024   # 10MB
@@ -217,7 +265,7 @@ def validate_video_format(file_path: str) -> bool:
         True 如果格式有效，False 否则
     """
     ext = os.path.splitext(file_path)[1].lower()
-    return ext in ALLOWED_VIDEO_EXTENSIONS
+    return EXT_TO_TYPE.get(ext) == "video"
 
 
 def validate_image_format(file_path: str) -> bool:
@@ -233,7 +281,7 @@ def validate_image_format(file_path: str) -> bool:
         True 如果格式有效，False 否则
     """
     ext = os.path.splitext(file_path)[1].lower()
-    return ext in ALLOWED_IMAGE_EXTENSIONS
+    return EXT_TO_TYPE.get(ext) == "image"
 
 
 def validate_media_format(file_path: str) -> Tuple[bool, str]:
@@ -252,12 +300,11 @@ def validate_media_format(file_path: str) -> Tuple[bool, str]:
     """
     ext = os.path.splitext(file_path)[1].lower()
     
-    if ext in ALLOWED_VIDEO_EXTENSIONS:
-        return True, "video"
-    elif ext in ALLOWED_IMAGE_EXTENSIONS:
-        return True, "image"
-    else:
+    # 单次查表得到媒体类型
+    media_type = EXT_TO_TYPE.get(ext)
+    if media_type is None:
         return False, "unknown"
+    return True, media_type
 
 
 def validate_video_file_size(file_path: str) -> Tuple[bool, int]:
@@ -376,28 +423,66 @@ def validate_media_file(file_path: str) -> Dict:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"文件不存在: {file_path}")
     
+    format_valid, media_type = validate_media_format(file_path)
+    ext = os.path.splitext(file_path)[1].lower()
+    
+    # 仅在格式有效时读取文件大小
+    file_size = os.path.getsize(file_path) if format_valid else 0
+    
+    return _build_media_validation_result(ext, media_type, file_size)
+
+
+def validate_media_files(dir_path: str) -> List[Dict]:
+    """
+    批量验证目录下的媒体文件 (Requirements 3.1, 3.2, 3.3, 3.4)
+    
+    使用 os.scandir 单次遍历目录，文件大小取自目录项，
+    避免逐个文件调用 validate_media_file 产生的重复 stat。
+    
+    Args:
+        dir_path: 目录路径
+    
+    Returns:
+        验证结果列表（按路径排序），每项字段同 validate_media_file，
+        另含 path 和 filename
+    
+    Raises:
+        FileNotFoundError: 如果目录不存在
+    """
+    results = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            ext = os.path.splitext(entry.name)[1].lower()
+            media_type = EXT_TO_TYPE.get(ext, "unknown")
+            file_size = entry.stat().st_size if media_type != "unknown" else 0
+            
+            result = _build_media_validation_result(ext, media_type, file_size)
+            result["path"] = entry.path
+            result["filename"] = entry.name
+            results.append(result)
+    
+    results.sort(key=lambda r: r["path"])
+    return results
+
+
+def _build_media_validation_result(ext: str, media_type: str, file_size: int) -> Dict:
+    """根据扩展名、媒体类型和文件大小构建验证结果字典"""
     result = {
         "valid": False,
-        "format_valid": False,
+        "format_valid": media_type != "unknown",
         "size_valid": False,
-        "media_type": "unknown",
+        "media_type": media_type,
         "file_size": 0,
         "max_size": 0,
         "error": None
     }
     
-    # 验证格式
-    format_valid, media_type = validate_media_format(file_path)
-    result["format_valid"] = format_valid
-    result["media_type"] = media_type
-    
-    if not format_valid:
-        ext = os.path.splitext(file_path)[1].lower()
+    if not result["format_valid"]:
         result["error"] = f"不支持的文件格式: {ext}"
         return result
     
-    # 获取文件大小
-    file_size = os.path.getsize(file_path)
     result["file_size"] = file_size
     
     # 根据媒体类型验证大小
@@ -456,10 +541,10 @@ def validate_transition_type(transition_type: str) -> str:
     Raises:
         ValueError: 如果转场类型无效
     """
-    if transition_type not in TRANSITIONS:
+    if transition_type not in _TRANSITION_KEYS:
         raise ValueError(
             f"无效的转场类型: {transition_type}，"
-            f"支持的类型: {list(TRANSITIONS.keys())}"
+            f"支持的类型: {_TRANSITION_KEY_LIST}"
         )
     return transition_type
 
@@ -480,28 +565,68 @@ def get_transition_config(transition_type: str, duration: Optional[float] = None
     """
     validate_transition_type(transition_type)
     
-    # 获取默认配置
-    config = TRANSITIONS[transition_type].copy()
+    base = TRANSITIONS[transition_type]
     
-    # 如果指定了自定义时长，验证并使用
-    if duration is not None:
-        if transition_type != "none":  # none 类型时长固定为 0
-            validate_transition_duration(duration)
-            config["duration"] = duration
+    # 如果指定了自定义时长，验证并使用（none 类型时长固定为 0）
+    if duration is not None and transition_type != "none":
+        validate_transition_duration(duration)
+    else:
+        duration = base["duration"]
     
-    config["type"] = transition_type
-    return config
+    return {"name": base["name"], "duration": duration, "type": transition_type}
 
 
 # ============================================================
 # 配置默认值验证函数 (Requirements 9.2, 9.3)
 # ============================================================
 
-def validate_config_defaults() -> Dict:
+# 数值型默认值校验表: (配置键, 名称, 默认值, 最小值, 最大值)
+_RANGE_SPECS = (
+    ("brightness", "亮度", BRIGHTNESS_DEFAULT, BRIGHTNESS_MIN, BRIGHTNESS_MAX),
+    ("contrast", "对比度", CONTRAST_DEFAULT, CONTRAST_MIN, CONTRAST_MAX),
+    ("saturation", "饱和度", SATURATION_DEFAULT, SATURATION_MIN, SATURATION_MAX),
+    ("transition_duration", "转场时长", TRANSITION_DURATION_DEFAULT, TRANSITION_DURATION_MIN, TRANSITION_DURATION_MAX),
+    ("bgm_volume", "BGM 音量", BGM_VOLUME_DEFAULT, BGM_VOLUME_MIN, BGM_VOLUME_MAX),
+    ("bgm_fade_in", "BGM 淡入时长", BGM_FADE_IN_DEFAULT, BGM_FADE_IN_MIN, BGM_FADE_IN_MAX),
+    ("bgm_fade_out", "BGM 淡出时长", BGM_FADE_OUT_DEFAULT, BGM_FADE_OUT_MIN, BGM_FADE_OUT_MAX),
+    ("clip_min_duration", "片段最小时长", CLIP_MIN_DURATION_DEFAULT, CLIP_MIN_DURATION_MIN, CLIP_MIN_DURATION_MAX),
+    ("clip_max_duration", "片段最大时长", CLIP_MAX_DURATION_DEFAULT, CLIP_MAX_DURATION_MIN, CLIP_MAX_DURATION_MAX),
+    ("subtitle_size", "字幕字号", SUBTITLE_SIZE_DEFAULT, SUBTITLE_SIZE_MIN, SUBTITLE_SIZE_MAX),
+    ("subtitle_stroke_width", "字幕描边宽度", SUBTITLE_STROKE_WIDTH_DEFAULT, SUBTITLE_STROKE_WIDTH_MIN, SUBTITLE_STROKE_WIDTH_MAX),
+)
+
+# 枚举型默认值校验表: (配置键, 名称, 默认值, 可选值集合, 可选值展示, 列表名称)
+_ENUM_SPECS = (
+    ("subtitle_position", "字幕位置", SUBTITLE_POSITION_DEFAULT, _SUBTITLE_POSITION_SET, SUBTITLE_POSITIONS, "位置"),
+    ("output_quality", "输出质量", OUTPUT_QUALITY_DEFAULT, _OUTPUT_QUALITY_SET, OUTPUT_QUALITIES, "质量"),
+    ("video_fps", "视频帧率", VIDEO_FPS_DEFAULT, _FRAME_RATE_SET, FRAME_RATES, "帧率"),
+    ("video_resolution", "视频分辨率", VIDEO_RESOLUTION_DEFAULT, _VIDEO_RESOLUTION_KEYS, _VIDEO_RESOLUTION_KEY_LIST, "分辨率"),
+    ("video_layout", "视频布局", VIDEO_LAYOUT_DEFAULT, _VIDEO_LAYOUT_KEYS, _VIDEO_LAYOUT_KEY_LIST, "布局"),
+    ("fit_mode", "素材适配模式", FIT_MODE_DEFAULT, _FIT_MODE_KEYS, _FIT_MODE_KEY_LIST, "模式"),
+    ("transition_type", "转场类型", TRANSITION_TYPE_DEFAULT, _TRANSITION_KEYS, _TRANSITION_KEY_LIST, "类型"),
+    ("color_filter", "颜色滤镜", COLOR_FILTER_DEFAULT, _COLOR_FILTER_KEYS, _COLOR_FILTER_KEY_LIST, "滤镜"),
+)
+
+
+def _record_default_error(errors: List[str], message: str, fast_fail: bool) -> None:
+    """记录默认值校验错误；fast_fail 模式下遇到第一个错误立即抛出"""
+    if fast_fail:
+        raise ValueError(message)
+    errors.append(message)
+
+
+@functools.lru_cache(maxsize=2)
+def validate_config_defaults(fast_fail: bool = False) -> Dict:
     """
     验证所有配置默认值在有效范围内 (Requirements 9.2, 9.3)
     
     检查系统中定义的所有默认值是否在其对应的有效范围内。
+    校验规则见 _RANGE_SPECS / _ENUM_SPECS，错误信息仅在校验失败时生成。
+    输入均为模块常量，结果只计算一次并缓存，调用方不应修改返回值。
+    
+    Args:
+        fast_fail: 为 True 时遇到第一个无效默认值立即抛出（适合启动检查），
+            否则收集全部错误后一并抛出
     
     Returns:
         验证结果字典，包含：
@@ -515,108 +640,25 @@ def validate_config_defaults() -> Dict:
     errors = []
     defaults = {}
     
-    # 验证亮度默认值
-    if not (BRIGHTNESS_MIN <= BRIGHTNESS_DEFAULT <= BRIGHTNESS_MAX):
-        errors.append(f"亮度默认值 {BRIGHTNESS_DEFAULT} 不在有效范围 [{BRIGHTNESS_MIN}, {BRIGHTNESS_MAX}] 内")
-    defaults["brightness"] = BRIGHTNESS_DEFAULT
-    
-    # 验证对比度默认值
-    if not (CONTRAST_MIN <= CONTRAST_DEFAULT <= CONTRAST_MAX):
-        errors.append(f"对比度默认值 {CONTRAST_DEFAULT} 不在有效范围 [{CONTRAST_MIN}, {CONTRAST_MAX}] 内")
-    defaults["contrast"] = CONTRAST_DEFAULT
-    
-    # 验证饱和度默认值
-    if not (SATURATION_MIN <= SATURATION_DEFAULT <= SATURATION_MAX):
-        errors.append(f"饱和度默认值 {SATURATION_DEFAULT} 不在有效范围 [{SATURATION_MIN}, {SATURATION_MAX}] 内")
-    defaults["saturation"] = SATURATION_DEFAULT
-    
-    # 验证转场时长默认值
-    if not (TRANSITION_DURATION_MIN <= TRANSITION_DURATION_DEFAULT <= TRANSITION_DURATION_MAX):
-        errors.append(f"转场时长默认值 {TRANSITION_DURATION_DEFAULT} 不在有效范围 [{TRANSITION_DURATION_MIN}, {TRANSITION_DURATION_MAX}] 内")
-    defaults["transition_duration"] = TRANSITION_DURATION_DEFAULT
-    
-    # 验证 BGM 音量默认值
-    if not (BGM_VOLUME_MIN <= BGM_VOLUME_DEFAULT <= BGM_VOLUME_MAX):
-        errors.append(f"BGM 音量默认值 {BGM_VOLUME_DEFAULT} 不在有效范围 [{BGM_VOLUME_MIN}, {BGM_VOLUME_MAX}] 内")
-    defaults["bgm_volume"] = BGM_VOLUME_DEFAULT
-    
-    # 验证 BGM 淡入时长默认值
-    if not (BGM_FADE_IN_MIN <= BGM_FADE_IN_DEFAULT <= BGM_FADE_IN_MAX):
-        errors.append(f"BGM 淡入时长默认值 {BGM_FADE_IN_DEFAULT} 不在有效范围 [{BGM_FADE_IN_MIN}, {BGM_FADE_IN_MAX}] 内")
-    defaults["bgm_fade_in"] = BGM_FADE_IN_DEFAULT
-    
-    # 验证 BGM 淡出时长默认值
-    if not (BGM_FADE_OUT_MIN <= BGM_FADE_OUT_DEFAULT <= BGM_FADE_OUT_MAX):
-        errors.append(f"BGM 淡出时长默认值 {BGM_FADE_OUT_DEFAULT} 不在有效范围 [{BGM_FADE_OUT_MIN}, {BGM_FADE_OUT_MAX}] 内")
-    defaults["bgm_fade_out"] = BGM_FADE_OUT_DEFAULT
-    
-    # 验证片段最小时长默认值
-    if not (CLIP_MIN_DURATION_MIN <= CLIP_MIN_DURATION_DEFAULT <= CLIP_MIN_DURATION_MAX):
-        errors.append(f"片段最小时长默认值 {CLIP_MIN_DURATION_DEFAULT} 不在有效范围 [{CLIP_MIN_DURATION_MIN}, {CLIP_MIN_DURATION_MAX}] 内")
-    defaults["clip_min_duration"] = CLIP_MIN_DURATION_DEFAULT
-    
-    # 验证片段最大时长默认值
-    if not (CLIP_MAX_DURATION_MIN <= CLIP_MAX_DURATION_DEFAULT <= CLIP_MAX_DURATION_MAX):
-        errors.append(f"片段最大时长默认值 {CLIP_MAX_DURATION_DEFAULT} 不在有效范围 [{CLIP_MAX_DURATION_MIN}, {CLIP_MAX_DURATION_MAX}] 内")
-    defaults["clip_max_duration"] = CLIP_MAX_DURATION_DEFAULT
+    # 验证数值型默认值
+    for key, label, value, min_value, max_value in _RANGE_SPECS:
+        if not (min_value <= value <= max_value):
+            _record_default_error(errors, f"{label}默认值 {value} 不在有效范围 [{min_value}, {max_value}] 内", fast_fail)
+        defaults[key] = value
     
     # 验证片段时长逻辑关系
     if CLIP_MIN_DURATION_DEFAULT > CLIP_MAX_DURATION_DEFAULT:
-        errors.append(f"片段最小时长默认值 {CLIP_MIN_DURATION_DEFAULT} 不能大于最大时长默认值 {CLIP_MAX_DURATION_DEFAULT}")
-    
-    # 验证字幕字号默认值
-    if not (SUBTITLE_SIZE_MIN <= SUBTITLE_SIZE_DEFAULT <= SUBTITLE_SIZE_MAX):
-        errors.append(f"字幕字号默认值 {SUBTITLE_SIZE_DEFAULT} 不在有效范围 [{SUBTITLE_SIZE_MIN}, {SUBTITLE_SIZE_MAX}] 内")
-    defaults["subtitle_size"] = SUBTITLE_SIZE_DEFAULT
-    
-    # 验证字幕描边宽度默认值
-    if not (SUBTITLE_STROKE_WIDTH_MIN <= SUBTITLE_STROKE_WIDTH_DEFAULT <= SUBTITLE_STROKE_WIDTH_MAX):
-        errors.append(f"字幕描边宽度默认值 {SUBTITLE_STROKE_WIDTH_DEFAULT} 不在有效范围 [{SUBTITLE_STROKE_WIDTH_MIN}, {SUBTITLE_STROKE_WIDTH_MAX}] 内")
-    defaults["subtitle_stroke_width"] = SUBTITLE_STROKE_WIDTH_DEFAULT
-    
-    # 验证字幕位置默认值
-    if SUBTITLE_POSITION_DEFAULT not in SUBTITLE_POSITIONS:
-        errors.append(f"字幕位置默认值 {SUBTITLE_POSITION_DEFAULT} 不在支持的位置列表 {SUBTITLE_POSITIONS} 中")
-    defaults["subtitle_position"] = SUBTITLE_POSITION_DEFAULT
-    
-    # 验证输出质量默认值
-    if OUTPUT_QUALITY_DEFAULT not in OUTPUT_QUALITIES:
-        errors.append(f"输出质量默认值 {OUTPUT_QUALITY_DEFAULT} 不在支持的质量列表 {OUTPUT_QUALITIES} 中")
-    defaults["output_quality"] = OUTPUT_QUALITY_DEFAULT
-    
-    # 验证视频帧率默认值
-    if VIDEO_FPS_DEFAULT not in FRAME_RATES:
-        errors.append(f"视频帧率默认值 {VIDEO_FPS_DEFAULT} 不在支持的帧率列表 {FRAME_RATES} 中")
-    defaults["video_fps"] = VIDEO_FPS_DEFAULT
-    
-    # 验证视频分辨率默认值
-    if VIDEO_RESOLUTION_DEFAULT not in VIDEO_RESOLUTIONS:
-        errors.append(f"视频分辨率默认值 {VIDEO_RESOLUTION_DEFAULT} 不在支持的分辨率列表 {list(VIDEO_RESOLUTIONS.keys())} 中")
-    defaults["video_resolution"] = VIDEO_RESOLUTION_DEFAULT
-    
-    # 验证视频布局默认值
-    if VIDEO_LAYOUT_DEFAULT not in VIDEO_LAYOUTS:
-        errors.append(f"视频布局默认值 {VIDEO_LAYOUT_DEFAULT} 不在支持的布局列表 {list(VIDEO_LAYOUTS.keys())} 中")
-    defaults["video_layout"] = VIDEO_LAYOUT_DEFAULT
-    
-    # 验证素材适配模式默认值
-    if FIT_MODE_DEFAULT not in FIT_MODES:
-        errors.append(f"素材适配模式默认值 {FIT_MODE_DEFAULT} 不在支持的模式列表 {list(FIT_MODES.keys())} 中")
-    defaults["fit_mode"] = FIT_MODE_DEFAULT
-    
-    # 验证转场类型默认值
-    if TRANSITION_TYPE_DEFAULT not in TRANSITIONS:
-        errors.append(f"转场类型默认值 {TRANSITION_TYPE_DEFAULT} 不在支持的类型列表 {list(TRANSITIONS.keys())} 中")
-    defaults["transition_type"] = TRANSITION_TYPE_DEFAULT
-    
-    # 验证颜色滤镜默认值
-    if COLOR_FILTER_DEFAULT not in COLOR_FILTERS:
-        errors.append(f"颜色滤镜默认值 {COLOR_FILTER_DEFAULT} 不在支持的滤镜列表 {list(COLOR_FILTERS.keys())} 中")
-    defaults["color_filter"] = COLOR_FILTER_DEFAULT
+        _record_default_error(errors, f"片段最小时长默认值 {CLIP_MIN_DURATION_DEFAULT} 不能大于最大时长默认值 {CLIP_MAX_DURATION_DEFAULT}", fast_fail)
+    
+    # 验证枚举型默认值
+    for key, label, value, allowed, display, kind in _ENUM_SPECS:
+        if value not in allowed:
+            _record_default_error(errors, f"{label}默认值 {value} 不在支持的{kind}列表 {list(display)} 中", fast_fail)
+        defaults[key] = value
     
     # 验证特效类型默认值（None 表示无特效，是有效的）
-    if EFFECT_TYPE_DEFAULT is not None and EFFECT_TYPE_DEFAULT not in EFFECT_TYPES:
-        errors.append(f"特效类型默认值 {EFFECT_TYPE_DEFAULT} 不在支持的特效列表 {list(EFFECT_TYPES.keys())} 中")
+    if EFFECT_TYPE_DEFAULT is not None and EFFECT_TYPE_DEFAULT not in _EFFECT_TYPE_KEYS:
+        _record_default_error(errors, f"特效类型默认值 {EFFECT_TYPE_DEFAULT} 不在支持的特效列表 {list(_EFFECT_TYPE_KEY_LIST)} 中", fast_fail)
     defaults["effect_type"] = EFFECT_TYPE_DEFAULT
     
     # 添加其他字符串默认值
@@ -634,6 +676,57 @@ def validate_config_defaults() -> Dict:
     }
 
 
+# 模块加载时校验一次默认值，配置错误在导入时即暴露（设置 SKIP_CONFIG_VALIDATION=1 可跳过以加快启动）
+if os.environ.get("SKIP_CONFIG_VALIDATION") != "1":
+    validate_config_defaults(fast_fail=True)
+
+
+# 默认配置模板（模块加载时构建一次，get_config_with_defaults 仅做复制与合并）
+_DEFAULT_CONFIG_TEMPLATE: Dict = {
+    # 视频配置
+    "video_resolution": VIDEO_RESOLUTION_DEFAULT,
+    "video_layout": VIDEO_LAYOUT_DEFAULT,
+    "video_fps": VIDEO_FPS_DEFAULT,
+    "fit_mode": FIT_MODE_DEFAULT,
+    
+    # 转场配置
+    "transition_type": TRANSITION_TYPE_DEFAULT,
+    "transition_duration": TRANSITION_DURATION_DEFAULT,
+    "transition_enabled": True,
+    
+    # 视频调节参数
+    "brightness": BRIGHTNESS_DEFAULT,
+    "contrast": CONTRAST_DEFAULT,
+    "saturation": SATURATION_DEFAULT,
+    
+    # 特效和滤镜
+    "color_filter": COLOR_FILTER_DEFAULT,
+    "effect_type": EFFECT_TYPE_DEFAULT,
+    
+    # BGM 配置
+    "bgm_volume": BGM_VOLUME_DEFAULT,
+    "bgm_fade_in": BGM_FADE_IN_DEFAULT,
+    "bgm_fade_out": BGM_FADE_OUT_DEFAULT,
+    "bgm_enabled": False,
+    
+    # 片段配置
+    "clip_min_duration": CLIP_MIN_DURATION_DEFAULT,
+    "clip_max_duration": CLIP_MAX_DURATION_DEFAULT,
+    
+    # 字幕配置
+    "subtitle_enabled": True,
+    "subtitle_font": SUBTITLE_FONT_DEFAULT,
+    "subtitle_size": SUBTITLE_SIZE_DEFAULT,
+    "subtitle_color": SUBTITLE_COLOR_DEFAULT,
+    "subtitle_stroke_color": SUBTITLE_STROKE_COLOR_DEFAULT,
+    "subtitle_stroke_width": SUBTITLE_STROKE_WIDTH_DEFAULT,
+    "subtitle_position": SUBTITLE_POSITION_DEFAULT,
+    
+    # 输出配置
+    "output_quality": OUTPUT_QUALITY_DEFAULT,
+}
+
+
 def get_config_with_defaults(config: Optional[Dict] = None) -> Dict:
     """
     获取带有默认值的配置 (Requirements 9.2, 9.3)
@@ -646,67 +739,19 @@ def get_config_with_defaults(config: Optional[Dict] = None) -> Dict:
     Returns:
         完整的配置字典，包含所有配置项（用户指定的值或默认值）
     """
-    if config is None:
-        config = {}
-    
-    # 创建带有默认值的配置
-    result = {
-        # 视频配置
-        "video_resolution": config.get("video_resolution", VIDEO_RESOLUTION_DEFAULT),
-        "video_layout": config.get("video_layout", VIDEO_LAYOUT_DEFAULT),
-        "video_fps": config.get("video_fps", VIDEO_FPS_DEFAULT),
-        "fit_mode": config.get("fit_mode", FIT_MODE_DEFAULT),
-        
-        # 转场配置
-        "transition_type": config.get("transition_type", TRANSITION_TYPE_DEFAULT),
-        "transition_duration": config.get("transition_duration", TRANSITION_DURATION_DEFAULT),
-        "transition_enabled": config.get("transition_enabled", True),
-        
-        # 视频调节参数
-        "brightness": config.get("brightness", BRIGHTNESS_DEFAULT),
-        "contrast": config.get("contrast", CONTRAST_DEFAULT),
-        "saturation": config.get("saturation", SATURATION_DEFAULT),
-        
-        # 特效和滤镜
-        "color_filter": config.get("color_filter", COLOR_FILTER_DEFAULT),
-        "effect_type": config.get("effect_type", EFFECT_TYPE_DEFAULT),
-        
-        # BGM 配置
-        "bgm_volume": config.get("bgm_volume", BGM_VOLUME_DEFAULT),
-        "bgm_fade_in": config.get("bgm_fade_in", BGM_FADE_IN_DEFAULT),
-        "bgm_fade_out": config.get("bgm_fade_out", BGM_FADE_OUT_DEFAULT),
-        "bgm_enabled": config.get("bgm_enabled", False),
-        
-        # 片段配置
-        "clip_min_duration": config.get("clip_min_duration", CLIP_MIN_DURATION_DEFAULT),
-        "clip_max_duration": config.get("clip_max_duration", CLIP_MAX_DURATION_DEFAULT),
-        
-        # 字幕配置
-        "subtitle_enabled": config.get("subtitle_enabled", True),
-        "subtitle_font": config.get("subtitle_font", SUBTITLE_FONT_DEFAULT),
-        "subtitle_size": config.get("subtitle_size", SUBTITLE_SIZE_DEFAULT),
-        "subtitle_color": config.get("subtitle_color", SUBTITLE_COLOR_DEFAULT),
-        "subtitle_stroke_color": config.get("subtitle_stroke_color", SUBTITLE_STROKE_COLOR_DEFAULT),
-        "subtitle_stroke_width": config.get("subtitle_stroke_width", SUBTITLE_STROKE_WIDTH_DEFAULT),
-        "subtitle_position": config.get("subtitle_position", SUBTITLE_POSITION_DEFAULT),
-        
-        # 输出配置
-        "output_quality": config.get("output_quality", OUTPUT_QUALITY_DEFAULT),
-    }
-    
-    # 保留用户提供的其他配置项
-    for key, value in config.items():
-        if key not in result:
-            result[key] = value
-    
+    # 单次 update 完成覆盖与保留其他配置项，每个用户键只访问一次
+    result = _DEFAULT_CONFIG_TEMPLATE.copy()
+    if config:
+        result.update(config)
     return result
 
 
+@functools.lru_cache(maxsize=1)
 def get_all_config_defaults() -> Dict:
     """
     获取所有配置项的默认值 (Requirements 9.2)
     
-    返回系统中所有配置项的默认值字典。
+    返回系统中所有配置项的默认值字典（缓存结果，调用方不应修改）。
     
     Returns:
         包含所有默认值的字典
@@ -753,11 +798,12 @@ def get_all_config_defaults() -> Dict:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_ranges() -> Dict:
     """
     获取所有配置项的有效范围 (Requirements 9.2)
     
-    返回系统中所有数值配置项的有效范围。
+    返回系统中所有数值配置项的有效范围（缓存结果，调用方不应修改）。
     
     Returns:
         包含所有配置项范围的字典
@@ -777,11 +823,12 @@ def get_config_ranges() -> Dict:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_options() -> Dict:
     """
     获取所有配置项的可选值列表 (Requirements 9.2)
     
-    返回系统中所有枚举类型配置项的可选值列表。
+    返回系统中所有枚举类型配置项的可选值列表（缓存结果，调用方不应修改）。
     
     Returns:
         包含所有配置项可选值的字典
@@ -804,11 +851,13 @@ def get_config_options() -> Dict:
 # 视频尺寸计算函数
 # ============================================================
 
+@functools.lru_cache(maxsize=64)
 def calculate_video_size(resolution: str, layout: str) -> Tuple[int, int]:
     """
     计算视频实际尺寸 (Requirements 5.1, 5.2)
     
     根据分辨率和布局计算实际视频尺寸。
+    组合数量有限，结果按 (resolution, layout) 缓存；无效参数不会被缓存，每次都会抛出异常。
     
     Args:
         resolution: 分辨率 (480p, 720p, 1080p, 2k, 4k)
@@ -820,16 +869,17 @@ def calculate_video_size(resolution: str, layout: str) -> Tuple[int, int]:
     Raises:
         ValueError: 如果分辨率或布局无效
     """
-    # 验证分辨率
-    if resolution not in VIDEO_RESOLUTIONS:
-        raise ValueError(f"无效的分辨率: {resolution}，支持的分辨率: {list(VIDEO_RESOLUTIONS.keys())}")
+    # 验证分辨率（单次查找）
+    base = VIDEO_RESOLUTIONS.get(resolution)
+    if base is None:
+        raise ValueError(f"无效的分辨率: {resolution}，支持的分辨率: {_VIDEO_RESOLUTION_KEY_LIST}")
     
-    # 验证布局
-    if layout not in VIDEO_LAYOUTS:
-        raise ValueError(f"无效的布局: {layout}，支持的布局: {list(VIDEO_LAYOUTS.keys())}")
+    # 验证布局（单次查找）
+    layout_config = VIDEO_LAYOUTS.get(layout)
+    if layout_config is None:
+        raise ValueError(f"无效的布局: {layout}，支持的布局: {_VIDEO_LAYOUT_KEY_LIST}")
     
-    base = VIDEO_RESOLUTIONS[resolution]
-    ratio = VIDEO_LAYOUTS[layout]["ratio"]
+    ratio = layout_config["ratio"]
     
     # 根据布局计算尺寸
     ratio_w, ratio_h = ratio
@@ -844,42 +894,44 @@ def calculate_video_size(resolution: str, layout: str) -> Tuple[int, int]:
         width = base["height"]  # 使用高度值作为宽度基准（因为竖屏宽度应该较小）
         height = int(width * ratio_h / ratio_w)
     
-    # 确保尺寸为偶数（视频编码要求）
-    width = width if width % 2 == 0 else width + 1
-    height = height if height % 2 == 0 else height + 1
+    # 确保尺寸为偶数（视频编码要求），奇数向上取偶
+    width = (width + 1) & ~1
+    height = (height + 1) & ~1
     
     return (width, height)
 
 
 def get_video_size(size: str, layout: str) -> Tuple[int, int]:
-    """获取视频尺寸"""
-    if size not in VIDEO_SIZES:
-        size = "1080p"
-    if layout not in ["portrait", "landscape"]:
-        layout = "portrait"
-    return VIDEO_SIZES[size][layout]
+    """获取视频尺寸（无效尺寸回退到 1080p，无效方向回退到竖屏）"""
+    entry = VIDEO_SIZES.get(size)
+    if entry is None:
+        entry = _DEFAULT_VIDEO_SIZE_ENTRY
+    return entry.get(layout) or entry["portrait"]
+
+
+# 句子分隔符：中英文句末标点及换行
+_SENTENCE_SPLIT_RE = re.compile(r'[。！？.!?\n]+')
 
 
 def split_script_to_sentences(script: str) -> List[str]:
     """将文案分割成句子"""
-    # 按中英文标点分割
-    sentences = re.split(r'[。！？.!?\n]+', script)
-    # 过滤空句子
-    sentences = [s.strip() for s in sentences if s.strip()]
-    return sentences
+    # 按中英文标点分割，同时过滤空句子
+    return [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(script)) if s]
 
 
 def get_media_files(directory: str) -> List[str]:
-    """获取目录下的媒体文件"""
-    if not os.path.exists(directory):
+    """获取目录下的媒体文件（目录不存在时返回空列表）"""
+    try:
+        with os.scandir(directory) as entries:
+            files = [
+                entry.path for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in EXT_TO_TYPE and entry.is_file()
+            ]
+    except FileNotFoundError:
         return []
     
-    files = []
-    for f in os.listdir(directory):
-        ext = os.path.splitext(f)[1].lower()
-        if ext in ALLOWED_VIDEO_EXTENSIONS or ext in ALLOWED_IMAGE_EXTENSIONS:
-            files.append(os.path.join(directory, f))
-    return sorted(files)
+    files.sort()
+    return files
 
 
 class VideoInfoError(Exception):
@@ -887,11 +939,147 @@ class VideoInfoError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _find_ffprobe() -> Optional[str]:
+    """查找 ffprobe 可执行文件路径，未安装时返回 None"""
+    return shutil.which("ffprobe")
+
+
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg() -> str:
+    """获取 ffmpeg 可执行文件路径（与 moviepy 使用同一个 ffmpeg）"""
+    from moviepy.config import get_setting
+    return get_setting("FFMPEG_BINARY")
+
+
+def _parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    """解析 ffprobe 的帧率字符串（如 "30000/1001"），无效时返回 None"""
+    if not rate:
+        return None
+    num, _, den = rate.partition("/")
+    try:
+        value = float(num) / float(den) if den else float(num)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return value if value > 0 else None
+
+
+def _probe_video_with_ffprobe(ffprobe: str, video_path: str) -> Tuple:
+    """
+    通过 ffprobe 读取视频头信息，无需解码视频帧
+    
+    Returns:
+        (duration, width, height, fps) 元组，缺失的字段为 None
+    
+    Raises:
+        VideoInfoError: 如果 ffprobe 执行失败或未找到视频流
+    """
+    result = subprocess.run(
+        [ffprobe, "-v", "error", "-print_format", "json",
+         "-show_streams", "-show_format", video_path],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise VideoInfoError(f"ffprobe 读取视频失败: {result.stderr.strip()}")
+    
+    data = json.loads(result.stdout or "{}")
+    stream = next(
+        (s for s in data.get("streams", []) if s.get("codec_type") == "video"),
+        None,
+    )
+    if stream is None:
+        raise VideoInfoError("未找到视频流")
+    
+    width = stream.get("width")
+    height = stream.get("height")
+    
+    # 旋转 90/270 度的视频按显示方向交换宽高（与 moviepy 行为一致）
+    rotation = stream.get("tags", {}).get("rotate")
+    if rotation is None:
+        rotation = next(
+            (d.get("rotation") for d in stream.get("side_data_list", []) if "rotation" in d),
+            0,
+        )
+    if abs(int(float(rotation))) % 180 == 90:
+        width, height = height, width
+    
+    fps = _parse_frame_rate(stream.get("avg_frame_rate")) or _parse_frame_rate(stream.get("r_frame_rate"))
+    duration = data.get("format", {}).get("duration") or stream.get("duration")
+    duration = float(duration) if duration is not None else None
+    
+    return duration, width, height, fps
+
+
+def _probe_video_with_moviepy(video_path: str) -> Tuple:
+    """通过 moviepy 读取视频信息（ffprobe 不可用时的回退方案）"""
+    from moviepy.editor import VideoFileClip
+    
+    clip = VideoFileClip(video_path)
+    try:
+        width = clip.size[0] if clip.size else None
+        height = clip.size[1] if clip.size else None
+        return clip.duration, width, height, clip.fps
+    finally:
+        # 确保资源被释放
+        try:
+            clip.close()
+        except Exception:
+            pass
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_video_info_cached(video_path: str, mtime_ns: int, file_size: int) -> Dict:
+    """
+    读取并校验视频信息，按 (路径, 修改时间, 文件大小) 缓存
+    
+    文件被修改后缓存键随之变化，不会返回过期信息；失败结果不会被缓存。
+    """
+    try:
+        ffprobe = _find_ffprobe()
+        if ffprobe is not None:
+            duration, width, height, fps = _probe_video_with_ffprobe(ffprobe, video_path)
+        else:
+            duration, width, height, fps = _probe_video_with_moviepy(video_path)
+    except VideoInfoError:
+        raise
+    except Exception as e:
+        # 捕获其他异常并转换为 VideoInfoError
+        raise VideoInfoError(f"提取视频信息时发生错误: {str(e)}") from e
+    
+    # 验证信息完整性
+    if duration is None or duration <= 0:
+        raise VideoInfoError(f"无法获取有效的视频时长: {duration}")
+    
+    if width is None or width <= 0:
+        raise VideoInfoError(f"无法获取有效的视频宽度: {width}")
+    
+    if height is None or height <= 0:
+        raise VideoInfoError(f"无法获取有效的视频高度: {height}")
+    
+    if fps is None or fps <= 0:
+        raise VideoInfoError(f"无法获取有效的视频帧率: {fps}")
+    
+    # 确保宽度和高度是整数
+    width = int(width)
+    height = int(height)
+    
+    return {
+        "duration": float(duration),
+        "width": width,
+        "height": height,
+        "fps": float(fps),
+        "size": (width, height),  # 保持向后兼容
+    }
+
+
 def get_video_info(video_path: str) -> Dict:
     """
     获取视频信息 (Requirements 3.5)
     
     从视频文件中提取完整的视频信息，包括时长、尺寸和帧率。
+    优先使用 ffprobe 只读取文件头，未安装 ffprobe 时回退到 moviepy；
+    同一文件（修改时间和大小不变）的重复查询直接命中缓存。
     
     Args:
         video_path: 视频文件路径
@@ -908,66 +1096,18 @@ def get_video_info(video_path: str) -> Dict:
         FileNotFoundError: 如果视频文件不存在
         VideoInfoError: 如果无法提取视频信息或信息不完整
     """
-    # 验证文件存在
-    if not os.path.exists(video_path):
-        raise FileNotFoundError(f"视频文件不存在: {video_path}")
-    
     # 验证文件格式
     ext = os.path.splitext(video_path)[1].lower()
     if ext not in ALLOWED_VIDEO_EXTENSIONS:
         raise VideoInfoError(f"不支持的视频格式: {ext}，支持的格式: {ALLOWED_VIDEO_EXTENSIONS}")
     
-    clip = None
+    # 验证文件存在（stat 同时提供缓存键，无需额外的 exists 检查）
     try:
-        clip = VideoFileClip(video_path)
-        
-        # 提取视频信息
-        duration = clip.duration
-        width = clip.size[0] if clip.size else None
-        height = clip.size[1] if clip.size else None
-        fps = clip.fps
-        
-        # 验证信息完整性
-        if duration is None or duration <= 0:
-            raise VideoInfoError(f"无法获取有效的视频时长: {duration}")
-        
-        if width is None or width <= 0:
-            raise VideoInfoError(f"无法获取有效的视频宽度: {width}")
-        
-        if height is None or height <= 0:
-            raise VideoInfoError(f"无法获取有效的视频高度: {height}")
-        
-        if fps is None or fps <= 0:
-            raise VideoInfoError(f"无法获取有效的视频帧率: {fps}")
-        
-        # 确保宽度和高度是整数
-        width = int(width)
-        height = int(height)
-        
-        return {
-            "duration": float(duration),
-            "width": width,
-            "height": height,
-            "fps": float(fps),
-            "size": (width, height),  # 保持向后兼容
-        }
-    
-    except VideoInfoError:
-        # 重新抛出 VideoInfoError
-        raise
+        stat = os.stat(video_path)
     except FileNotFoundError:
-        # 重新抛出 FileNotFoundError
-        raise
-    except Exception as e:
-        # 捕获其他异常并转换为 VideoInfoError
-        raise VideoInfoError(f"提取视频信息时发生错误: {str(e)}") from e
-    finally:
-        # 确保资源被释放
-        if clip is not None:
-            try:
-                clip.close()
-            except Exception:
-                pass
+        raise FileNotFoundError(f"视频文件不存在: {video_path}") from None
+    # 返回副本，避免调用方修改缓存中的结果
+    return dict(_get_video_info_cached(video_path, stat.st_mtime_ns, stat.st_size))
 
 
 class VideoTrimError(Exception):
@@ -1020,6 +1160,55 @@ def validate_trim_time_range(
     return (start_time, end_time)
 
 
+# 开始时间与前一个关键帧的最大偏差（秒），在此范围内直接流复制而不重新编码
+TRIM_KEYFRAME_TOLERANCE = 0.1
+
+
+def _find_keyframe_before(ffprobe: str, video_path: str, time: float) -> Optional[float]:
+    """
+    查找不晚于指定时间的最近关键帧时间点
+    
+    只读取到 time + TRIM_KEYFRAME_TOLERANCE 为止的关键帧，找不到时返回 None。
+    """
+    result = subprocess.run(
+        [ffprobe, "-v", "error", "-select_streams", "v:0",
+         "-skip_frame", "nokey",
+         "-read_intervals", f"%{time + TRIM_KEYFRAME_TOLERANCE:.3f}",
+         "-show_entries", "frame=best_effort_timestamp_time",
+         "-of", "csv=p=0", video_path],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    
+    keyframe = None
+    for line in result.stdout.split():
+        try:
+            ts = float(line.strip(","))
+        except ValueError:
+            continue
+        if ts <= time + 1e-6 and (keyframe is None or ts > keyframe):
+            keyframe = ts
+    return keyframe
+
+
+def _trim_stream_copy(input_path: str, output_path: str, start_time: float, end_time: float) -> None:
+    """使用 ffmpeg 流复制裁剪视频（不重新编码，要求开始时间位于关键帧）"""
+    result = subprocess.run(
+        [_find_ffmpeg(), "-v", "error", "-y",
+         "-ss", f"{start_time:.3f}", "-i", input_path,
+         "-t", f"{end_time - start_time:.3f}",
+         "-c", "copy", "-avoid_negative_ts", "make_zero",
+         "-movflags", "+faststart",
+         output_path],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise VideoTrimError(f"流复制裁剪失败: {result.stderr.strip()}")
+
+
 def trim_video(
     input_path: str,
     output_path: str,
@@ -1030,6 +1219,7 @@ def trim_video(
     裁剪视频片段 (Requirements 4.3, 4.4, 4.5)
     
     从输入视频中裁剪指定时间范围的片段。
+    开始时间位于关键帧附近时使用 ffmpeg 流复制（不重新编码），否则用 moviepy 重新编码。
     
     Args:
         input_path: 输入视频路径
@@ -1051,20 +1241,28 @@ def trim_video(
         VideoTrimError: 如果时间范围无效
         VideoInfoError: 如果无法读取视频信息
     """
-    # 验证输入文件存在
-    if not os.path.exists(input_path):
-        raise FileNotFoundError(f"输入视频文件不存在: {input_path}")
+    from moviepy.editor import VideoFileClip
     
-    # 验证文件格式
+    # 验证文件格式（文件是否存在由打开时的异常判断，不单独 stat）
     ext = os.path.splitext(input_path)[1].lower()
     if ext not in ALLOWED_VIDEO_EXTENSIONS:
         raise VideoTrimError(f"不支持的视频格式: {ext}")
     
+    ffprobe = _find_ffprobe()
     clip = None
     trimmed = None
     try:
-        clip = VideoFileClip(input_path)
-        video_duration = clip.duration
+        if ffprobe is not None:
+            video_duration = get_video_info(input_path)["duration"]
+        else:
+            try:
+                clip = VideoFileClip(input_path)
+            except OSError:
+                # 仅在打开失败时才检查文件是否存在
+                if not os.path.exists(input_path):
+                    raise FileNotFoundError(f"输入视频文件不存在: {input_path}")
+                raise
+            video_duration = clip.duration
         
         # 验证时间范围
         validated_start, validated_end = validate_trim_time_range(
@@ -1074,37 +1272,48 @@ def trim_video(
         # 计算期望的裁剪时长
         expected_duration = validated_end - validated_start
         
-        # 裁剪视频
-        trimmed = clip.subclip(validated_start, validated_end)
-        
         # 确保输出目录存在
         output_dir = os.path.dirname(output_path)
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         
-        # 导出视频，使用更精确的编码设置
-        trimmed.write_videofile(
-            output_path,
-            codec="libx264",
-            audio_codec="aac",
-            threads=4,
-            preset="fast",
-            verbose=False,
-            logger=None
-        )
+        # 流复制只在输出与输入容器相同时使用，避免编码不被目标容器支持
+        # （如 webm 中的 VP8 无法写入 mp4）
+        keyframe = None
+        if ffprobe is not None and os.path.splitext(output_path)[1].lower() == ext:
+            keyframe = _find_keyframe_before(ffprobe, input_path, validated_start)
         
-        # 验证输出视频的实际时长
         actual_duration = None
-        precision_error = None
-        
-        if os.path.exists(output_path):
+        if keyframe is not None and validated_start - keyframe <= TRIM_KEYFRAME_TOLERANCE:
+            # 开始时间对齐关键帧，直接流复制；实际时长用 ffprobe 读取输出文件头
             try:
-                output_info = get_video_info(output_path)
-                actual_duration = output_info["duration"]
-                precision_error = abs(actual_duration - expected_duration)
-            except Exception:
-                # 如果无法获取输出视频信息，不影响主流程
-                pass
+                _trim_stream_copy(input_path, output_path, validated_start, validated_end)
+                actual_duration = get_video_info(output_path)["duration"]
+            except (VideoTrimError, VideoInfoError):
+                # 流复制失败时回退到重新编码
+                actual_duration = None
+        
+        if actual_duration is None:
+            if clip is None:
+                clip = VideoFileClip(input_path)
+            
+            # 裁剪视频
+            trimmed = clip.subclip(validated_start, validated_end)
+            
+            # 导出视频，使用更精确的编码设置
+            trimmed.write_videofile(
+                output_path,
+                codec="libx264",
+                audio_codec="aac",
+                threads=4,
+                preset="fast",
+                verbose=False,
+                logger=None
+            )
+            # 写出的片段时长即输出视频时长，无需重新打开输出文件
+            actual_duration = trimmed.duration
+        
+        precision_error = abs(actual_duration - expected_duration)
         
         return {
             "output_path": output_path,
@@ -1137,6 +1346,22 @@ def trim_video(
                 pass
 
 
+def _extract_thumbnail(ffmpeg: str, video_path: str, time: float, thumb_path: str) -> None:
+    """用 ffmpeg 在指定时间点截取一帧并缩放保存为 JPEG（-ss 置于 -i 前以按关键帧快速定位）"""
+    result = subprocess.run(
+        [ffmpeg, "-v", "error", "-y",
+         "-ss", f"{time:.3f}", "-i", video_path,
+         "-frames:v", "1",
+         "-vf", "scale='min(320,iw)':'min(180,ih)':force_original_aspect_ratio=decrease",
+         "-q:v", "4",
+         thumb_path],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0 or not os.path.exists(thumb_path):
+        raise RuntimeError(f"提取缩略图失败 ({time:.2f}s): {result.stderr.strip()}")
+
+
 def extract_video_thumbnails(
     video_path: str,
     output_dir: str,
@@ -1145,6 +1370,8 @@ def extract_video_thumbnails(
     """
     提取视频缩略图
     
+    各时间点相互独立，并行调用 ffmpeg 快速定位截帧，无需逐帧解码整段视频。
+    
     Args:
         video_path: 视频路径
         output_dir: 输出目录
@@ -1154,71 +1381,56 @@ def extract_video_thumbnails(
         缩略图路径列表
     """
     os.makedirs(output_dir, exist_ok=True)
-    thumbnails = []
+    if count <= 0:
+        return []
     
-    with VideoFileClip(video_path) as clip:
-        duration = clip.duration
-        interval = duration / (count + 1)
-        
-        for i in range(count):
-            time = interval * (i + 1)
-            frame = clip.get_frame(time)
-            
-            # 保存缩略图
-            img = Image.fromarray(frame)
-            img.thumbnail((320, 180))  # 缩小尺寸
-            
-            thumb_path = os.path.join(output_dir, f"thumb_{i:03d}.jpg")
-            img.save(thumb_path, "JPEG", quality=80)
-            thumbnails.append({
-                "path": thumb_path,
-                "time": round(time, 2)
-            })
+    duration = get_video_info(video_path)["duration"]
+    interval = duration / (count + 1)
+    ffmpeg = _find_ffmpeg()
+    
+    thumbnails = [
+        {
+            "path": os.path.join(output_dir, f"thumb_{i:03d}.jpg"),
+            "time": interval * (i + 1),
+        }
+        for i in range(count)
+    ]
+    
+    with ThreadPoolExecutor(max_workers=min(count, os.cpu_count() or 1)) as executor:
+        list(executor.map(
+            lambda thumb: _extract_thumbnail(ffmpeg, video_path, thumb["time"], thumb["path"]),
+            thumbnails,
+        ))
+    
+    for thumb in thumbnails:
+        thumb["time"] = round(thumb["time"], 2)
     
     return thumbnails
 
 
-def create_text_clip(
+def _render_text_clip(
     text: str,
-    duration: float,
-    size: Tuple[int, int],
-    font: str = "Heiti-SC-Medium",
-    fontsize: int = 48,
-    color: str = "white",
-    stroke_color: str = "black",
-    stroke_width: float = 2,
-    position: str = "bottom"
-) -> TextClip:
-    """创建字幕片段"""
-    width, height = size
-    margin_x = 50  # 水平边距
-    margin_y = 50  # 垂直边距
-    
-    # 位置映射 - 支持9个位置
-    pos_map = {
-        "top_left": (margin_x, margin_y),
-        "top": ("center", margin_y),
-        "top_right": (width - margin_x, margin_y),
-        "left": (margin_x, "center"),
-        "center": ("center", "center"),
-        "right": (width - margin_x, "center"),
-        "bottom_left": (margin_x, height - margin_y - 100),
-        "bottom": ("center", height - margin_y - 100),
-        "bottom_right": (width - margin_x, height - margin_y - 100),
-    }
+    font: str,
+    fontsize: int,
+    color: str,
+    stroke_color: str,
+    stroke_width: float,
+    width: int,
+    align: str,
+    cache: Optional[Dict] = None
+) -> "TextClip":
+    """
+    渲染字幕原型片段（每次渲染都会调用 ImageMagick）
     
-    # 对齐方式映射
-    align_map = {
-        "top_left": "West",
-        "top": "center",
-        "top_right": "East",
-        "left": "West",
-        "center": "center",
-        "right": "East",
-        "bottom_left": "West",
-        "bottom": "center",
-        "bottom_right": "East",
-    }
+    传入 cache 时按文本和样式缓存结果。缓存由调用方在单次视频生成内创建，
+    片段持有完整的图像和遮罩数组，不应在进程内长期保留。
+    返回的原型不应被直接修改，调用方通过 set_duration/set_start 等方法获得副本。
+    """
+    key = (text, font, fontsize, color, stroke_color, stroke_width, width, align)
+    if cache is not None and key in cache:
+        return cache[key]
+    
+    from moviepy.editor import TextClip
     
     txt_clip = TextClip(
         text,
@@ -1227,13 +1439,91 @@ def create_text_clip(
         color=color,
         stroke_color=stroke_color,
         stroke_width=stroke_width,
-        size=(size[0] - 100, None),  # 留边距
+        size=(width, None),
         method='caption',
-        align=align_map.get(position, 'center')
+        align=align
+    )
+    if cache is not None:
+        cache[key] = txt_clip
+    return txt_clip
+
+
+_SUBTITLE_MARGIN_X = 50  # 字幕水平边距
+_SUBTITLE_MARGIN_Y = 50  # 字幕垂直边距
+_SUBTITLE_BOTTOM_OFFSET = 100  # 底部字幕额外上移距离
+
+# 字幕位置锚点 - 支持9个位置: 位置 -> (水平锚点, 垂直锚点)
+# 锚点: "start" 靠左/上边距, "center" 居中, "end" 靠右/下边距
+_SUBTITLE_POSITION_ANCHORS = {
+    "top_left": ("start", "start"),
+    "top": ("center", "start"),
+    "top_right": ("end", "start"),
+    "left": ("start", "center"),
+    "center": ("center", "center"),
+    "right": ("end", "center"),
+    "bottom_left": ("start", "end"),
+    "bottom": ("center", "end"),
+    "bottom_right": ("end", "end"),
+}
+
+# 对齐方式映射
+_SUBTITLE_ALIGN_MAP = {
+    "top_left": "West",
+    "top": "center",
+    "top_right": "East",
+    "left": "West",
+    "center": "center",
+    "right": "East",
+    "bottom_left": "West",
+    "bottom": "center",
+    "bottom_right": "East",
+}
+
+
+def _subtitle_position(position: str, size: Tuple[int, int]) -> Tuple:
+    """根据字幕位置名称和视频尺寸计算 set_position 坐标，未知位置按 bottom 处理"""
+    width, height = size
+    x_anchor, y_anchor = _SUBTITLE_POSITION_ANCHORS.get(position, ("center", "end"))
+    
+    if x_anchor == "start":
+        x = _SUBTITLE_MARGIN_X
+    elif x_anchor == "end":
+        x = width - _SUBTITLE_MARGIN_X
+    else:
+        x = "center"
+    
+    if y_anchor == "start":
+        y = _SUBTITLE_MARGIN_Y
+    elif y_anchor == "end":
+        y = height - _SUBTITLE_MARGIN_Y - _SUBTITLE_BOTTOM_OFFSET
+    else:
+        y = "center"
+    
+    return (x, y)
+
+
+def create_text_clip(
+    text: str,
+    duration: float,
+    size: Tuple[int, int],
+    font: str = "Heiti-SC-Medium",
+    fontsize: int = 48,
+    color: str = "white",
+    stroke_color: str = "black",
+    stroke_width: float = 2,
+    position: str = "bottom",
+    text_cache: Optional[Dict] = None
+) -> "TextClip":
+    """创建字幕片段（text_cache 为单次视频生成内共用的字幕渲染缓存，可选）"""
+    txt_clip = _render_text_clip(
+        text, font, fontsize, color, stroke_color, stroke_width,
+        size[0] - 100,  # 留边距
+        _SUBTITLE_ALIGN_MAP.get(position, 'center'),
+        text_cache
     )
     
     txt_clip = txt_clip.set_duration(duration)
-    txt_clip = txt_clip.set_position(pos_map.get(position, pos_map["bottom"]))
+    txt_clip = txt_clip.set_position(_subtitle_position(position, size))
     
     return txt_clip
 
@@ -1275,7 +1565,12 @@ def create_word_highlight_clips(
             continue
         
         words = sentence["words"]
-        full_text = sentence["text"]
+        
+        # 底层完整句子（普通颜色）对每个词都相同，只渲染一次
+        base_proto = _render_text_clip(
+            sentence["text"], font, fontsize, color, stroke_color, stroke_width,
+            size[0] - 100, 'center'
+        )
         
         # 为每个词创建高亮效果
         for i, word in enumerate(words):
@@ -1291,25 +1586,42 @@ def create_word_highlight_clips(
             # 由于 moviepy 不支持部分着色，我们用两层叠加实现
             
             # 底层：完整句子（普通颜色）
-            base_clip = TextClip(
-                full_text,
-                fontsize=fontsize,
-                font=font,
-                color=color,
-                stroke_color=stroke_color,
-                stroke_width=stroke_width,
-                size=(size[0] - 100, None),
-                method='caption',
-                align='center'
-            ).set_duration(word_duration).set_start(word_start).set_position(("center", pos_y))
+            base_clip = base_proto.set_duration(word_duration).set_start(word_start).set_position(("center", pos_y))
             
             clips.append(base_clip)
     
     return clips
 
 
+def _scale_crop_clip(clip, new_size: Tuple[int, int], box: Tuple[int, int, int, int]):
+    """
+    在一次帧变换中完成缩放和裁剪，避免 resize + crop 两次逐帧处理
+    
+    Args:
+        clip: MoviePy 视频/图片片段
+        new_size: 缩放后的尺寸 (width, height)
+        box: 裁剪区域 (x1, y1, x2, y2)，基于缩放后的坐标
+    """
+    from moviepy.video.fx.resize import resizer
+    
+    x1, y1, x2, y2 = box
+    
+    def scale_crop(frame):
+        return resizer(frame.astype('uint8'), new_size)[y1:y2, x1:x2]
+    
+    def scale_crop_mask(frame):
+        return (1.0 * resizer((255 * frame).astype('uint8'), new_size) / 255.0)[y1:y2, x1:x2]
+    
+    new_clip = clip.fl_image(scale_crop)
+    if clip.mask is not None:
+        new_clip.mask = clip.mask.fl_image(scale_crop_mask)
+    return new_clip
+
+
 def resize_clip_to_fill(clip, target_size: Tuple[int, int]):
-    """调整视频/图片尺寸以填充目标尺寸（裁剪方式）"""
+    """调整视频/图片尺寸以填充目标尺寸（裁剪方式，缩放与裁剪合并为一次帧变换）"""
+    _ensure_pil_compat()
+    
     target_w, target_h = target_size
     target_ratio = target_w / target_h
     
@@ -1320,18 +1632,16 @@ def resize_clip_to_fill(clip, target_size: Tuple[int, int]):
         # 视频更宽，按高度缩放后裁剪宽度
         new_h = target_h
         new_w = int(clip_w * (target_h / clip_h))
-        clip = clip.resize(height=new_h)
         x_center = new_w // 2
-        clip = clip.crop(x1=x_center - target_w // 2, x2=x_center + target_w // 2)
+        box = (x_center - target_w // 2, 0, x_center + target_w // 2, new_h)
     else:
         # 视频更高，按宽度缩放后裁剪高度
         new_w = target_w
         new_h = int(clip_h * (target_w / clip_w))
-        clip = clip.resize(width=new_w)
         y_center = new_h // 2
-        clip = clip.crop(y1=y_center - target_h // 2, y2=y_center + target_h // 2)
+        box = (0, y_center - target_h // 2, new_w, y_center + target_h // 2)
     
-    return clip
+    return _scale_crop_clip(clip, (new_w, new_h), box)
 
 
 # ============================================================
@@ -1351,18 +1661,24 @@ def adapt_media_crop(clip, target_size: Tuple[int, int]):
     Returns:
         调整后的片段，尺寸等于目标尺寸
     """
+    # 已经是目标尺寸时无需缩放和裁剪
+    if tuple(clip.size) == tuple(target_size):
+        return clip
+    
+    _ensure_pil_compat()
+    
     target_w, target_h = target_size
     clip_w, clip_h = clip.size
     
-    target_ratio = target_w / target_h
-    clip_ratio = clip_w / clip_h
+    # 用整数交叉相乘比较宽高比：cross > 0 表示素材更宽
+    cross = clip_w * target_h - clip_h * target_w
     
-    # 处理比例相等或非常接近的情况：直接缩放到目标尺寸
-    if abs(clip_ratio - target_ratio) < 0.01:
+    # 处理比例相等或非常接近的情况（宽高比相差小于 0.01）：直接缩放到目标尺寸
+    if abs(cross) * 100 < clip_h * target_h:
         clip = clip.resize(newsize=target_size)
         return clip
     
-    if clip_ratio > target_ratio:
+    if cross > 0:
         # 素材更宽，按高度缩放后裁剪宽度
         new_h = target_h
         new_w = int(clip_w * (target_h / clip_h))
@@ -1396,13 +1712,19 @@ def adapt_media_fit(clip, target_size: Tuple[int, int], bg_color: Tuple[int, int
     Returns:
         调整后的片段，尺寸等于目标尺寸，素材保持原比例
     """
+    from moviepy.editor import ColorClip, CompositeVideoClip
+    
+    # 已经是目标尺寸且没有透明遮罩时素材铺满画布，不会露出背景
+    if tuple(clip.size) == tuple(target_size) and clip.mask is None:
+        return clip
+    
+    _ensure_pil_compat()
+    
     target_w, target_h = target_size
     clip_w, clip_h = clip.size
     
-    target_ratio = target_w / target_h
-    clip_ratio = clip_w / clip_h
-    
-    if clip_ratio > target_ratio:
+    # 整数交叉相乘比较宽高比，避免浮点除法
+    if clip_w * target_h > clip_h * target_w:
         # 素材更宽，按宽度缩放（上下留黑边）
         new_w = target_w
         new_h = int(clip_h * (target_w / clip_w))
@@ -1435,6 +1757,11 @@ def adapt_media_stretch(clip, target_size: Tuple[int, int]):
     Returns:
         调整后的片段，尺寸等于目标尺寸
     """
+    if tuple(clip.size) == tuple(target_size):
+        return clip
+    
+    _ensure_pil_compat()
+    
     return clip.resize(newsize=target_size)
 
 
@@ -1461,8 +1788,8 @@ def adapt_media_to_size(
     Raises:
         ValueError: 如果 fit_mode 无效
     """
-    if fit_mode not in FIT_MODES:
-        raise ValueError(f"无效的适配模式: {fit_mode}，支持的模式: {list(FIT_MODES.keys())}")
+    if fit_mode not in _FIT_MODE_KEYS:
+        raise ValueError(f"无效的适配模式: {fit_mode}，支持的模式: {_FIT_MODE_KEY_LIST}")
     
     if fit_mode == "crop":
         return adapt_media_crop(clip, target_size)
@@ -1490,6 +1817,8 @@ def apply_fade_transition(clip1, clip2, duration: float = 0.5):
     Returns:
         合成后的片段
     """
+    from moviepy.editor import CompositeVideoClip
+    
     # 确保 clip1 有足够的时长进行淡出
     if clip1.duration <= duration:
         duration = clip1.duration * 0.5
@@ -1522,6 +1851,8 @@ def apply_slide_transition(clip1, clip2, direction: str, duration: float = 0.5):
     Returns:
         合成后的片段
     """
+    from moviepy.editor import CompositeVideoClip
+    
     width, height = clip1.size
     
     # 确保 clip1 有足够的时长
@@ -1603,46 +1934,12 @@ def apply_zoom_transition(clip1, clip2, direction: str, duration: float = 0.5):
     Returns:
         合成后的片段
     """
-    width, height = clip1.size
+    from moviepy.editor import CompositeVideoClip
     
     # 确保 clip1 有足够的时长
     if clip1.duration <= duration:
         duration = clip1.duration * 0.5
     
-    transition_start = clip1.duration - duration
-    
-    def zoom_out_effect(get_frame, t):
-        """clip1 缩小效果"""
-        if t < transition_start:
-            return get_frame(t)
-        
-        progress = (t - transition_start) / duration
-        progress = min(1.0, max(0.0, progress))
-        
-        if direction == "in":
-            # zoom_in: clip1 缩小消失
-            scale = 1.0 - progress * 0.5
-        else:
-            # zoom_out: clip1 放大消失
-            scale = 1.0 + progress * 0.5
-        
-        frame = get_frame(t)
-        # 简单返回原帧，实际缩放通过 resize 实现
-        return frame
-    
-    def zoom_in_effect(get_frame, t):
-        """clip2 放大效果"""
-        if t < transition_start:
-            return get_frame(0)
-        
-        progress = (t - transition_start) / duration
-        progress = min(1.0, max(0.0, progress))
-        
-        actual_t = (t - transition_start) * clip2.duration / duration if duration > 0 else 0
-        actual_t = min(actual_t, clip2.duration - 0.01)
-        
-        return get_frame(actual_t)
-    
     # 对于缩放效果，使用淡入淡出作为简化实现
     # 真正的缩放效果需要更复杂的帧处理
     clip1_fadeout = clip1.crossfadeout(duration)
@@ -1683,7 +1980,10 @@ def apply_wipe_transition(clip1, clip2, direction: str, duration: float = 0.5):
     Returns:
         合成后的片段
     """
-    width, height = clip1.size
+    import numpy as np
+    from moviepy.editor import CompositeAudioClip, VideoClip
+    
+    width = clip1.size[0]
     
     # 确保 clip1 有足够的时长
     if clip1.duration <= duration:
@@ -1691,33 +1991,43 @@ def apply_wipe_transition(clip1, clip2, direction: str, duration: float = 0.5):
     
     transition_start = clip1.duration - duration
     
-    def make_wipe_mask(t):
-        """创建擦除遮罩"""
-        import numpy as np
-        
+    def make_frame(t):
+        """擦除分界线两侧分别取两个片段的像素"""
         if t < transition_start:
-            # 完全显示 clip1
-            return np.ones((height, width))
-        
-        progress = (t - transition_start) / duration
-        progress = min(1.0, max(0.0, progress))
+            return clip1.get_frame(t)
+        if t >= clip1.duration:
+            return clip2.get_frame(t - transition_start)
         
-        mask = np.zeros((height, width))
+        progress = min(1.0, max(0.0, (t - transition_start) / duration))
+        frame1 = clip1.get_frame(t)
+        frame2 = clip2.get_frame(t - transition_start)
+        out = np.empty_like(frame1)
         
         if direction == "left":
-            # 从右向左擦除
+            # 从右向左擦除：clip1 保留在分界线左侧
             wipe_x = int(width * (1 - progress))
-            mask[:, :wipe_x] = 1.0
+            out[:, :wipe_x] = frame1[:, :wipe_x]
+            out[:, wipe_x:] = frame2[:, wipe_x:]
         else:
-            # 从左向右擦除
+            # 从左向右擦除：clip1 保留在分界线右侧
             wipe_x = int(width * progress)
-            mask[:, wipe_x:] = 1.0
+            out[:, :wipe_x] = frame2[:, :wipe_x]
+            out[:, wipe_x:] = frame1[:, wipe_x:]
         
-        return mask
+        return out
     
-    # 简化实现：使用淡入淡出代替复杂的遮罩
-    # 真正的擦除效果需要自定义遮罩处理
-    return apply_fade_transition(clip1, clip2, duration)
+    result = VideoClip(make_frame, duration=clip1.duration + clip2.duration - duration)
+    fps = getattr(clip1, 'fps', None) or getattr(clip2, 'fps', None)
+    if fps:
+        result = result.set_fps(fps)
+    
+    audio_tracks = [clip1.audio] if clip1.audio is not None else []
+    if clip2.audio is not None:
+        audio_tracks.append(clip2.audio.set_start(transition_start))
+    if audio_tracks:
+        result = result.set_audio(CompositeAudioClip(audio_tracks))
+    
+    return result
 
 
 def apply_transition(
@@ -1742,6 +2052,8 @@ def apply_transition(
     Raises:
         ValueError: 如果转场类型或时长无效
     """
+    from moviepy.editor import concatenate_videoclips
+    
     # 验证转场类型
     validate_transition_type(transition_type)
     
@@ -1780,6 +2092,61 @@ def apply_transition(
     return concatenate_videoclips([clip1, clip2])
 
 
+# 以交叉淡化实现的转场类型（可以在同一条时间线上一次合成）
+_CROSSFADE_TRANSITIONS = frozenset({"fade", "dissolve", "zoom_in", "zoom_out"})
+
+
+def _compose_crossfade_timeline(clips: List, duration: float):
+    """
+    将多个片段按交叉淡化转场排布到同一条时间线上，一次性合成
+    
+    与逐对调用 apply_fade_transition 的效果相同：前一段末尾淡出、
+    后一段开头淡入并与之重叠 duration 秒；累计时长不足时转场时长
+    同样减半。每帧只需从正在重叠的片段取帧。
+    
+    只有每个片段都不短于两侧转场时长之和时（任意时刻最多两个片段重叠）
+    结果才与逐对合成相同，否则返回 None，由调用方逐对合成。
+    
+    Args:
+        clips: 视频片段列表（至少两个）
+        duration: 转场时长（秒）
+    
+    Returns:
+        合成后的单个片段，无法排布到同一时间线时返回 None
+    """
+    from moviepy.editor import CompositeVideoClip
+    
+    # 预先计算每个衔接处的转场时长（与逐对合成时的时长修正一致，
+    # 逐对合成的结果时长取最晚结束的片段）
+    overlaps = []
+    end = clips[0].duration
+    for clip in clips[1:]:
+        overlap = end * 0.5 if end <= duration else duration
+        overlaps.append(overlap)
+        end = max(end, end - overlap + clip.duration)
+    
+    # 片段短于两侧转场之和时会有三个片段同时重叠，平铺结果与逐对合成不同
+    last = len(clips) - 1
+    for i, clip in enumerate(clips):
+        left = overlaps[i - 1] if i > 0 else 0.0
+        right = overlaps[i] if i < last else 0.0
+        if clip.duration < left + right:
+            return None
+    
+    layers = []
+    start = 0.0
+    for i, clip in enumerate(clips):
+        if i > 0:
+            clip = clip.crossfadein(overlaps[i - 1])
+        if i < last:
+            clip = clip.crossfadeout(overlaps[i])
+        layers.append(clip.set_start(start))
+        if i < last:
+            start += clip.duration - overlaps[i]
+    
+    return CompositeVideoClip(layers, size=clips[0].size)
+
+
 def apply_transitions_to_clips(
     clips: List,
     transition_type: str = "fade",
@@ -1810,6 +2177,18 @@ def apply_transitions_to_clips(
     if transition_type != "none":
         validate_transition_duration(duration)
     
+    # 无转场：一次性拼接全部片段
+    if transition_type == "none":
+        from moviepy.editor import concatenate_videoclips
+        return concatenate_videoclips(clips)
+    
+    # 交叉淡化类转场：所有片段放在同一条时间线上合成一次，
+    # 避免逐个嵌套 CompositeVideoClip 导致每帧递归取帧
+    if transition_type in _CROSSFADE_TRANSITIONS:
+        result = _compose_crossfade_timeline(clips, duration)
+        if result is not None:
+            return result
+    
     # 逐个应用转场
     result = clips[0]
     for i in range(1, len(clips)):
@@ -1822,6 +2201,22 @@ def apply_transitions_to_clips(
 # 视频特效函数 (Requirements 10.1)
 # ============================================================
 
+def _get_static_frame(clip):
+    """
+    如果片段是静态图片（任意时间点的帧都相同），返回该帧，否则返回 None
+    
+    只有未经时间相关变换的 ImageClip 才返回其图像（get_frame 直接返回 clip.img 本身），
+    例如经过 fadein 等 fl 变换的 ImageClip 帧随时间变化，不视为静态。
+    """
+    from moviepy.editor import ImageClip
+    
+    if isinstance(clip, ImageClip):
+        frame = clip.get_frame(0)
+        if frame is clip.img:
+            return frame
+    return None
+
+
 def apply_ken_burns_effect(
     clip,
     duration: Optional[float] = None,
@@ -1857,9 +2252,15 @@ def apply_ken_burns_effect(
     
     effect_duration = duration if duration is not None else clip.duration
     original_size = clip.size
+    cv2 = _get_cv2()
+    # 静态图片只取一次源帧，避免每帧重复获取
+    static_frame = _get_static_frame(clip)
+    # OpenCV 缩放结果写入复用的缓冲区（按最大缩放尺寸分配一次），避免逐帧分配大数组
+    scratch = None
     
     def make_frame(t):
         """生成每一帧的缩放效果"""
+        nonlocal scratch
         # 计算当前时间的缩放比例
         progress = t / effect_duration if effect_duration > 0 else 0
         progress = min(1.0, max(0.0, progress))
@@ -1872,25 +2273,30 @@ def apply_ken_burns_effect(
             current_zoom = zoom_ratio - (zoom_ratio - 1.0) * progress
         
         # 获取原始帧
-        frame = clip.get_frame(t)
+        frame = static_frame if static_frame is not None else clip.get_frame(t)
         
         # 计算缩放后的尺寸
         new_width = int(original_size[0] * current_zoom)
         new_height = int(original_size[1] * current_zoom)
         
-        # 使用 PIL 进行高质量缩放
-        img = PILImage.fromarray(frame)
-        img_resized = img.resize((new_width, new_height), PILImage.LANCZOS)
+        # 高质量缩放：优先使用 OpenCV，未安装时回退到 PIL
+        if cv2 is not None:
+            shape = (new_height, new_width) + frame.shape[2:]
+            if scratch is None or scratch.dtype != frame.dtype:
+                max_shape = (int(original_size[1] * zoom_ratio) + 1,
+                             int(original_size[0] * zoom_ratio) + 1) + frame.shape[2:]
+                scratch = np.empty(int(np.prod(max_shape)), dtype=frame.dtype)
+            resized = scratch[:int(np.prod(shape))].reshape(shape)
+            cv2.resize(frame, (new_width, new_height), dst=resized, interpolation=cv2.INTER_LANCZOS4)
+        else:
+            resized = np.asarray(PILImage.fromarray(frame).resize((new_width, new_height), PILImage.LANCZOS))
         
-        # 裁剪中心区域以保持原始尺寸
+        # 裁剪中心区域以保持原始尺寸（NumPy 切片，不再经过 PIL crop）；
+        # 缓冲区下一帧会被覆盖，因此总是拷贝出独立的帧
         left = (new_width - original_size[0]) // 2
         top = (new_height - original_size[1]) // 2
-        right = left + original_size[0]
-        bottom = top + original_size[1]
-        
-        img_cropped = img_resized.crop((left, top, right, bottom))
         
-        return np.array(img_cropped)
+        return resized[top:top + original_size[1], left:left + original_size[0]].copy()
     
     # 创建新的视频片段
     from moviepy.editor import VideoClip
@@ -1917,10 +2323,10 @@ def validate_effect_type(effect_type: str) -> str:
     Raises:
         ValueError: 如果特效类型无效
     """
-    if effect_type not in EFFECT_TYPES:
+    if effect_type not in _EFFECT_TYPE_KEYS:
         raise ValueError(
             f"无效的特效类型: {effect_type}，"
-            f"支持的类型: {list(EFFECT_TYPES.keys())}"
+            f"支持的类型: {_EFFECT_TYPE_KEY_LIST}"
         )
     return effect_type
 
@@ -1993,9 +2399,23 @@ def apply_shake_effect(clip, duration: Optional[float] = None):
     effect_duration = duration if duration is not None else clip.duration
     original_size = clip.size
     shake_amplitude = 5  # 抖动幅度（像素）
+    fps = getattr(clip, 'fps', None) or 30
+    
+    # 按帧率预先计算整段时长内每一帧的抖动偏移，逐帧查表
+    if effect_duration:
+        frame_count = int(effect_duration * fps) + 2
+        frame_times = np.arange(frame_count) / fps
+        x_offsets = (shake_amplitude * np.sin(frame_times * 10)).tolist()
+        y_offsets = (shake_amplitude * np.cos(frame_times * 8)).tolist()
+    else:
+        frame_count = 0
     
     def shake_position(t):
         """计算抖动位置"""
+        # 渲染时 t 落在帧时间点上，直接查表
+        index = round(t * fps)
+        if index < frame_count and abs(t * fps - index) < 1e-6:
+            return (x_offsets[index], y_offsets[index])
         # 使用正弦函数产生平滑的抖动
         x_offset = shake_amplitude * np.sin(t * 10)
         y_offset = shake_amplitude * np.cos(t * 8)
@@ -2017,11 +2437,11 @@ def apply_pan_effect(clip, duration: Optional[float] = None, direction: str = "l
         应用效果后的视频片段
     """
     import numpy as np
-    from PIL import Image as PILImage
     
     effect_duration = duration if duration is not None else clip.duration
-    original_size = clip.size
-    pan_distance = int(original_size[0] * 0.1)  # 平移距离为宽度的 10%
+    pan_distance = int(clip.size[0] * 0.1)  # 平移距离为宽度的 10%
+    # 静态图片只取一次源帧，避免每帧重复获取
+    static_frame = _get_static_frame(clip)
     
     def make_frame(t):
         """生成每一帧的平移效果"""
@@ -2029,7 +2449,7 @@ def apply_pan_effect(clip, duration: Optional[float] = None, direction: str = "l
         progress = min(1.0, max(0.0, progress))
         
         # 获取原始帧
-        frame = clip.get_frame(t)
+        frame = static_frame if static_frame is not None else clip.get_frame(t)
         
         # 计算偏移量
         if direction == "left":
@@ -2048,27 +2468,17 @@ def apply_pan_effect(clip, duration: Optional[float] = None, direction: str = "l
             x_offset = 0
             y_offset = 0
         
-        # 使用 PIL 进行平移
-        img = PILImage.fromarray(frame)
+        # 平移即整体偏移 (x_offset, y_offset)，露出的区域填充黑色；
+        # 直接切片拷贝到同尺寸的黑色帧上，无需经过 PIL 画布
+        height, width = frame.shape[:2]
+        result = np.zeros_like(frame)
+        if abs(x_offset) < width and abs(y_offset) < height:
+            result[max(y_offset, 0):height + min(y_offset, 0),
+                   max(x_offset, 0):width + min(x_offset, 0)] = \
+                frame[max(-y_offset, 0):height + min(-y_offset, 0),
+                      max(-x_offset, 0):width + min(-x_offset, 0)]
         
-        # 创建稍大的画布以容纳平移
-        canvas_size = (original_size[0] + abs(x_offset) * 2, 
-                       original_size[1] + abs(y_offset) * 2)
-        canvas = PILImage.new('RGB', canvas_size, (0, 0, 0))
-        
-        # 将图片放置在画布上
-        paste_x = abs(x_offset) + x_offset
-        paste_y = abs(y_offset) + y_offset
-        canvas.paste(img, (paste_x, paste_y))
-        
-        # 裁剪回原始尺寸
-        crop_x = abs(x_offset)
-        crop_y = abs(y_offset)
-        result = canvas.crop((crop_x, crop_y, 
-                              crop_x + original_size[0], 
-                              crop_y + original_size[1]))
-        
-        return np.array(result)
+        return result
     
     from moviepy.editor import VideoClip
     result = VideoClip(make_frame, duration=effect_duration)
@@ -2097,14 +2507,152 @@ def validate_color_filter(filter_type: str) -> str:
     Raises:
         ValueError: 如果滤镜类型无效
     """
-    if filter_type not in COLOR_FILTERS:
+    if filter_type not in _COLOR_FILTER_KEYS:
         raise ValueError(
             f"无效的滤镜类型: {filter_type}，"
-            f"支持的类型: {list(COLOR_FILTERS.keys())}"
+            f"支持的类型: {_COLOR_FILTER_KEY_LIST}"
         )
     return filter_type
 
 
+# 暖色/冷色调的 RGB 通道缩放系数，高对比度的拉伸系数
+_WARM_CHANNEL_SCALES = (1.15, 1.05, 0.85)
+_COOL_CHANNEL_SCALES = (0.9, 0.95, 1.15)
+_HIGH_CONTRAST_FACTOR = 1.4
+# 仿射颜色变换分块处理的行数（1080p 下每块的 float32 中间结果约 1.5MB）
+_COLOR_TILE_ROWS = 64
+
+
+def _apply_affine_color(img, matrix, bias=None):
+    """
+    对帧做一次仿射颜色变换 out = clip(img @ matrix + bias, 0, 255)
+
+    matrix 为 (3, 3)，按行向量约定做矩阵乘法（matrix[i, j] 为输入通道 i
+    对输出通道 j 的贡献）。返回 float32 数组，便于串联多段变换，调用方
+    最后再转回 uint8。安装了 OpenCV 时交给 cv2.transform，乘加和偏置在
+    一遍 SIMD 循环内完成。
+    """
+    import numpy as np
+
+    cv2 = _get_cv2()
+    if cv2 is not None:
+        transform = matrix.T
+        if bias is not None:
+            transform = np.hstack([transform, np.reshape(bias, (3, 1))])
+        out = cv2.transform(
+            np.asarray(img, dtype=np.float32),
+            np.ascontiguousarray(transform, dtype=np.float32),
+        )
+    else:
+        # uint8 帧直接与 float32 矩阵相乘，由类型提升完成转换
+        out = img @ matrix
+        if bias is not None:
+            out += bias
+    np.clip(out, 0, 255, out=out)
+    return out
+
+
+def _apply_affine_color_stages(frame, stages):
+    """
+    按行分块依次应用多段仿射颜色变换，结果直接写入 uint8 输出帧
+    
+    每块的 float32 中间结果只有几 MB，留在缓存中反复使用，
+    不必为整帧分配 float32 缓冲区并多次往返内存。
+    
+    Args:
+        frame: 输入帧 (H, W, 3)
+        stages: [(matrix, bias), ...]，按顺序应用，每段之后截断到 0-255
+    
+    Returns:
+        uint8 输出帧
+    """
+    import numpy as np
+    
+    out = np.empty(frame.shape, dtype=np.uint8)
+    for top in range(0, frame.shape[0], _COLOR_TILE_ROWS):
+        rows = slice(top, top + _COLOR_TILE_ROWS)
+        img = frame[rows]
+        for matrix, bias in stages:
+            img = _apply_affine_color(img, matrix, bias)
+        out[rows] = img
+    return out
+
+
+@functools.lru_cache(maxsize=8)
+def _channel_scale_lut(scales: Tuple[float, float, float], pivot: float = 0.0):
+    """
+    构建按通道缩放的查找表 out = clip((x - pivot) * scale + pivot, 0, 255)
+
+    逐通道缩放只依赖单个像素值，可以预先对 0-255 全部取值算好，
+    逐帧只需查表，无需浮点运算。
+
+    Returns:
+        (256, 3) 的 uint8 查找表
+    """
+    import numpy as np
+
+    values = np.arange(256, dtype=np.float32)[:, None]
+    lut = (values - pivot) * np.array(scales, dtype=np.float32) + pivot
+    return np.clip(lut, 0, 255).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=1)
+def _soft_tone_lut():
+    """构建柔和滤镜的查找表：降低对比度 (x - 128) * 0.85 + 128 后再提亮 5%"""
+    import numpy as np
+
+    values = np.arange(256, dtype=np.float32)
+    values = ((values - 128) * 0.85 + 128) * 1.05
+    lut = np.clip(values, 0, 255).astype(np.uint8)
+    return np.repeat(lut[:, None], 3, axis=1)
+
+
+def _apply_channel_lut(frame, lut):
+    """按通道查表变换 RGB 帧，安装了 OpenCV 时使用 cv2.LUT"""
+    import numpy as np
+
+    frame = np.asarray(frame, dtype=np.uint8)
+    cv2 = _get_cv2()
+    if cv2 is not None and frame.ndim == 3 and frame.shape[2] == 3:
+        return cv2.LUT(frame, lut.reshape(256, 1, 3))
+    return lut[frame, np.arange(3)]
+
+
+@functools.lru_cache(maxsize=1)
+def _vintage_color_transform():
+    """
+    预先合成复古滤镜的颜色矩阵
+
+    去饱和与暖色通道缩放合成第一段矩阵（其后按原逻辑截断到 0-255），
+    降低对比度与褐色混合合成第二段矩阵和偏置。
+
+    Returns:
+        (warm_matrix, sepia_matrix, sepia_bias)，均为 float32
+    """
+    import numpy as np
+
+    # 降低饱和度：每个通道 0.7 * 自身 + 0.3 * 三通道均值
+    desaturate = 0.7 * np.eye(3) + 0.1 * np.ones((3, 3))
+    warm_matrix = desaturate @ np.diag([1.1, 1.05, 0.9])
+
+    # 褐色矩阵（按列为输出通道），与原图按 0.6 / 0.4 混合
+    sepia = np.array([
+        [0.393, 0.349, 0.272],
+        [0.769, 0.686, 0.534],
+        [0.189, 0.168, 0.131],
+    ])
+    blend = 0.6 * np.eye(3) + 0.4 * sepia
+    # 降低对比度 (x - 128) * 0.9 + 128 在混合之前
+    sepia_matrix = 0.9 * blend
+    sepia_bias = (128 * (1 - 0.9)) * np.ones(3) @ blend
+
+    return (
+        warm_matrix.astype(np.float32),
+        sepia_matrix.astype(np.float32),
+        sepia_bias.astype(np.float32),
+    )
+
+
 def apply_grayscale_filter(clip):
     """
     应用黑白滤镜 (Requirements 10.2)
@@ -2115,6 +2663,8 @@ def apply_grayscale_filter(clip):
     Returns:
         应用滤镜后的视频片段
     """
+    from moviepy.editor import vfx
+    
     return clip.fx(vfx.blackwhite)
 
 
@@ -2130,36 +2680,14 @@ def apply_vintage_filter(clip):
     Returns:
         应用滤镜后的视频片段
     """
-    import numpy as np
+    warm_matrix, sepia_matrix, sepia_bias = _vintage_color_transform()
+    
+    # 先降低饱和度并添加暖色调，再轻微降低对比度并混合褐色色调
+    stages = ((warm_matrix, None), (sepia_matrix, sepia_bias))
     
     def vintage_effect(frame):
         """应用复古效果到单帧"""
-        # 转换为浮点数进行处理
-        img = frame.astype(np.float32)
-        
-        # 降低饱和度（向灰度靠近）
-        gray = np.mean(img, axis=2, keepdims=True)
-        img = img * 0.7 + gray * 0.3
-        
-        # 添加暖色调（增加红色和黄色）
-        img[:, :, 0] = np.clip(img[:, :, 0] * 1.1, 0, 255)  # 红色通道
-        img[:, :, 1] = np.clip(img[:, :, 1] * 1.05, 0, 255)  # 绿色通道
-        img[:, :, 2] = np.clip(img[:, :, 2] * 0.9, 0, 255)  # 蓝色通道
-        
-        # 轻微降低对比度
-        img = (img - 128) * 0.9 + 128
-        
-        # 添加轻微的褐色色调
-        sepia_r = img[:, :, 0] * 0.393 + img[:, :, 1] * 0.769 + img[:, :, 2] * 0.189
-        sepia_g = img[:, :, 0] * 0.349 + img[:, :, 1] * 0.686 + img[:, :, 2] * 0.168
-        sepia_b = img[:, :, 0] * 0.272 + img[:, :, 1] * 0.534 + img[:, :, 2] * 0.131
-        
-        # 混合原图和褐色效果
-        img[:, :, 0] = img[:, :, 0] * 0.6 + sepia_r * 0.4
-        img[:, :, 1] = img[:, :, 1] * 0.6 + sepia_g * 0.4
-        img[:, :, 2] = img[:, :, 2] * 0.6 + sepia_b * 0.4
-        
-        return np.clip(img, 0, 255).astype(np.uint8)
+        return _apply_affine_color_stages(frame, stages)
     
     return clip.fl_image(vintage_effect)
 
@@ -2176,18 +2704,12 @@ def apply_warm_filter(clip):
     Returns:
         应用滤镜后的视频片段
     """
-    import numpy as np
+    lut = _channel_scale_lut(_WARM_CHANNEL_SCALES)
     
     def warm_effect(frame):
         """应用暖色调效果到单帧"""
-        img = frame.astype(np.float32)
-        
         # 增加红色和黄色，减少蓝色
-        img[:, :, 0] = np.clip(img[:, :, 0] * 1.15, 0, 255)  # 红色通道增强
-        img[:, :, 1] = np.clip(img[:, :, 1] * 1.05, 0, 255)  # 绿色通道轻微增强
-        img[:, :, 2] = np.clip(img[:, :, 2] * 0.85, 0, 255)  # 蓝色通道减弱
-        
-        return img.astype(np.uint8)
+        return _apply_channel_lut(frame, lut)
     
     return clip.fl_image(warm_effect)
 
@@ -2204,18 +2726,12 @@ def apply_cool_filter(clip):
     Returns:
         应用滤镜后的视频片段
     """
-    import numpy as np
+    lut = _channel_scale_lut(_COOL_CHANNEL_SCALES)
     
     def cool_effect(frame):
         """应用冷色调效果到单帧"""
-        img = frame.astype(np.float32)
-        
         # 减少红色，增加蓝色
-        img[:, :, 0] = np.clip(img[:, :, 0] * 0.9, 0, 255)  # 红色通道减弱
-        img[:, :, 1] = np.clip(img[:, :, 1] * 0.95, 0, 255)  # 绿色通道轻微减弱
-        img[:, :, 2] = np.clip(img[:, :, 2] * 1.15, 0, 255)  # 蓝色通道增强
-        
-        return img.astype(np.uint8)
+        return _apply_channel_lut(frame, lut)
     
     return clip.fl_image(cool_effect)
 
@@ -2232,17 +2748,12 @@ def apply_high_contrast_filter(clip):
     Returns:
         应用滤镜后的视频片段
     """
-    import numpy as np
+    # 增强对比度：以 128 为中心将像素值向两端拉伸
+    lut = _channel_scale_lut((_HIGH_CONTRAST_FACTOR,) * 3, pivot=128)
     
     def high_contrast_effect(frame):
         """应用高对比度效果到单帧"""
-        img = frame.astype(np.float32)
-        
-        # 增强对比度：将像素值向两端拉伸
-        contrast_factor = 1.4
-        img = (img - 128) * contrast_factor + 128
-        
-        return np.clip(img, 0, 255).astype(np.uint8)
+        return _apply_channel_lut(frame, lut)
     
     return clip.fl_image(high_contrast_effect)
 
@@ -2263,29 +2774,39 @@ def apply_soft_filter(clip):
     from PIL import Image as PILImage
     from PIL import ImageFilter
     
+    cv2 = _get_cv2()
+    lut = _soft_tone_lut()
+    
     def soft_effect(frame):
         """应用柔和效果到单帧"""
         # 确保输入是 uint8 类型
         if frame.dtype != np.uint8:
-            frame = np.clip(frame, 0, 255).astype(np.uint8)
-        
-        # 使用 PIL 进行轻微模糊
-        img = PILImage.fromarray(frame)
-        img = img.filter(ImageFilter.GaussianBlur(radius=0.5))
-        img_array = np.array(img).astype(np.float32)
+            frame = np.clip(frame, 0, 255, out=np.empty(frame.shape, np.uint8), casting="unsafe")
         
-        # 降低对比度
-        contrast_factor = 0.85
-        img_array = (img_array - 128) * contrast_factor + 128
-        
-        # 轻微提亮
-        img_array = img_array * 1.05
+        # 轻微模糊：优先使用 OpenCV 高斯模糊，未安装时回退到 PIL
+        if cv2 is not None:
+            blurred = cv2.GaussianBlur(frame, (3, 3), 0.5)
+        else:
+            img = PILImage.fromarray(frame)
+            blurred = np.asarray(img.filter(ImageFilter.GaussianBlur(radius=0.5)))
         
-        return np.clip(img_array, 0, 255).astype(np.uint8)
+        # 降低对比度并轻微提亮（逐像素映射，查表完成）
+        return _apply_channel_lut(blurred, lut)
     
     return clip.fl_image(soft_effect)
 
 
+# 滤镜类型到处理函数的分派表（"none" 不在表中，直接返回原片段）
+_COLOR_FILTER_APPLIERS = {
+    "grayscale": apply_grayscale_filter,
+    "vintage": apply_vintage_filter,
+    "warm": apply_warm_filter,
+    "cool": apply_cool_filter,
+    "high_contrast": apply_high_contrast_filter,
+    "soft": apply_soft_filter,
+}
+
+
 def apply_color_filter(clip, filter_type: str):
     """
     应用颜色滤镜 (Requirements 10.2)
@@ -2303,28 +2824,10 @@ def apply_color_filter(clip, filter_type: str):
     """
     validate_color_filter(filter_type)
     
-    if filter_type == "none":
+    apply_filter = _COLOR_FILTER_APPLIERS.get(filter_type)
+    if apply_filter is None:
         return clip
-    
-    elif filter_type == "grayscale":
-        return apply_grayscale_filter(clip)
-    
-    elif filter_type == "vintage":
-        return apply_vintage_filter(clip)
-    
-    elif filter_type == "warm":
-        return apply_warm_filter(clip)
-    
-    elif filter_type == "cool":
-        return apply_cool_filter(clip)
-    
-    elif filter_type == "high_contrast":
-        return apply_high_contrast_filter(clip)
-    
-    elif filter_type == "soft":
-        return apply_soft_filter(clip)
-    
-    return clip
+    return apply_filter(clip)
 
 
 # ============================================================
@@ -2434,18 +2937,16 @@ def adjust_brightness(clip, brightness: float = 1.0):
     Raises:
         ValueError: 如果亮度值不在有效范围内
     """
-    import numpy as np
-    
     validate_brightness(brightness)
     
     if brightness == 1.0:
         return clip
     
+    lut = _brightness_contrast_lut(brightness, 1.0)
+    
     def brightness_effect(frame):
         """调节单帧亮度"""
-        img = frame.astype(np.float32)
-        img = img * brightness
-        return np.clip(img, 0, 255).astype(np.uint8)
+        return _apply_channel_lut(frame, lut)
     
     return clip.fl_image(brightness_effect)
 
@@ -2464,19 +2965,17 @@ def adjust_contrast(clip, contrast: float = 1.0):
     Raises:
         ValueError: 如果对比度值不在有效范围内
     """
-    import numpy as np
-    
     validate_contrast(contrast)
     
     if contrast == 1.0:
         return clip
     
+    # 对比度调节：以 128 为中心进行缩放
+    lut = _brightness_contrast_lut(1.0, contrast)
+    
     def contrast_effect(frame):
         """调节单帧对比度"""
-        img = frame.astype(np.float32)
-        # 对比度调节：以 128 为中心进行缩放
-        img = (img - 128) * contrast + 128
-        return np.clip(img, 0, 255).astype(np.uint8)
+        return _apply_channel_lut(frame, lut)
     
     return clip.fl_image(contrast_effect)
 
@@ -2495,29 +2994,70 @@ def adjust_saturation(clip, saturation: float = 1.0):
     Raises:
         ValueError: 如果饱和度值不在有效范围内
     """
-    import numpy as np
-    
     validate_saturation(saturation)
     
     if saturation == 1.0:
         return clip
     
+    # 饱和度调节：在原图和灰度图之间插值（合成为一次矩阵乘法）
+    # saturation = 0 时完全灰度，saturation = 1 时原图，saturation > 1 时增强饱和度
+    stages = (_adjustment_transform(1.0, 1.0, saturation),)
+    
     def saturation_effect(frame):
         """调节单帧饱和度"""
-        img = frame.astype(np.float32)
-        
-        # 计算灰度值
-        gray = np.mean(img, axis=2, keepdims=True)
-        
-        # 饱和度调节：在原图和灰度图之间插值
-        # saturation = 0 时完全灰度，saturation = 1 时原图，saturation > 1 时增强饱和度
-        img = gray + (img - gray) * saturation
-        
-        return np.clip(img, 0, 255).astype(np.uint8)
+        return _apply_affine_color_stages(frame, stages)
     
     return clip.fl_image(saturation_effect)
 
 
+@functools.lru_cache(maxsize=32)
+def _brightness_contrast_lut(brightness: float, contrast: float):
+    """
+    构建亮度、对比度调节的查找表
+    
+    依次为：亮度 x * brightness；对比度 (x - 128) * contrast + 128。
+    
+    Returns:
+        (256, 3) 的 uint8 查找表（三个通道相同）
+    """
+    import numpy as np
+    
+    values = np.arange(256, dtype=np.float32)
+    if brightness != 1.0:
+        values = values * brightness
+    if contrast != 1.0:
+        values = (values - 128) * contrast + 128
+    lut = np.clip(values, 0, 255).astype(np.uint8)
+    return np.repeat(lut[:, None], 3, axis=1)
+
+
+# BT.601 亮度权重（R, G, B），饱和度调节以此计算灰度
+_LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+
+@functools.lru_cache(maxsize=32)
+def _adjustment_transform(brightness: float, contrast: float, saturation: float):
+    """
+    将亮度、对比度、饱和度调节合成为一个仿射颜色变换
+    
+    依次为：亮度 x * brightness；对比度 (x - 128) * contrast + 128；
+    饱和度 gray + (x - gray) * saturation（gray 为 BT.601 亮度
+    0.299R + 0.587G + 0.114B）。
+    
+    Returns:
+        (matrix, bias)，按 _apply_affine_color 的行向量约定，均为 float32
+    """
+    import numpy as np
+    
+    # 饱和度：saturation * x + (1 - saturation) * gray，gray = x @ 亮度权重
+    luma = np.array(_LUMA_WEIGHTS)[:, None]
+    saturation_matrix = saturation * np.eye(3) + (1 - saturation) * luma * np.ones((1, 3))
+    matrix = brightness * contrast * saturation_matrix
+    # 亮度权重之和为 1，饱和度矩阵每列之和也为 1，对比度偏置经过它保持不变
+    bias = np.full(3, 128 * (1 - contrast))
+    return matrix.astype(np.float32), bias.astype(np.float32)
+
+
 def apply_video_adjustments(
     clip,
     brightness: float = 1.0,
@@ -2539,33 +3079,34 @@ def apply_video_adjustments(
     Raises:
         ValueError: 如果任何参数不在有效范围内
     """
-    import numpy as np
-    
     # 验证所有参数
     validate_video_adjustments(brightness, contrast, saturation)
     
+    return _apply_video_adjustments_unchecked(clip, brightness, contrast, saturation)
+
+
+def _apply_video_adjustments_unchecked(clip, brightness: float, contrast: float, saturation: float):
+    """应用已在有效范围内的亮度/对比度/饱和度调节（调用方负责校验或限制范围）"""
     # 如果所有参数都是默认值，直接返回原片段
     if brightness == 1.0 and contrast == 1.0 and saturation == 1.0:
         return clip
     
-    def combined_adjustment(frame):
-        """组合调节单帧"""
-        img = frame.astype(np.float32)
-        
-        # 1. 调节亮度
-        if brightness != 1.0:
-            img = img * brightness
-        
-        # 2. 调节对比度
-        if contrast != 1.0:
-            img = (img - 128) * contrast + 128
+    # 不调节饱和度时，亮度和对比度只依赖单个像素值，合成为一张查找表
+    if saturation == 1.0:
+        lut = _brightness_contrast_lut(brightness, contrast)
         
-        # 3. 调节饱和度
-        if saturation != 1.0:
-            gray = np.mean(img, axis=2, keepdims=True)
-            img = gray + (img - gray) * saturation
+        def tone_adjustment(frame):
+            """组合调节单帧亮度和对比度"""
+            return _apply_channel_lut(frame, lut)
         
-        return np.clip(img, 0, 255).astype(np.uint8)
+        return clip.fl_image(tone_adjustment)
+    
+    # 亮度、对比度、饱和度都是线性变换，合成为一次仿射颜色变换
+    stages = (_adjustment_transform(brightness, contrast, saturation),)
+    
+    def combined_adjustment(frame):
+        """组合调节单帧"""
+        return _apply_affine_color_stages(frame, stages)
     
     return clip.fl_image(combined_adjustment)
 
@@ -2677,6 +3218,47 @@ def apply_bgm_fade_effects(
 # 音频混合函数 (Requirements 6.6, 6.7)
 # ============================================================
 
+_AUDIO_MIX_FPS = 44100  # 混音与导出使用的音频采样率
+_AUDIO_ARRAY_MIX_MAX_DURATION = 120.0  # 直接在内存中混音的最大时长（秒）
+
+
+def _mix_audio_arrays(audio_clips, fps: int = _AUDIO_MIX_FPS):
+    """
+    将多条音轨解码为采样数组后直接相加，返回基于该数组的音频片段
+    
+    较短的音轨在末尾补零，单声道音轨扩展为多声道，混合结果限制在
+    [-1, 1] 范围内。取样时按最近采样点取值，不使用 AudioArrayClip：
+    它会丢弃第 0 个采样，且 fps * t 截断取整会错位一个采样。
+    """
+    import numpy as np
+    from moviepy.audio.AudioClip import AudioClip
+    
+    tracks = []
+    for audio_clip in audio_clips:
+        # 与导出时一致按块取样；moviepy 的 to_soundarray 在长片段上无法拼接生成器
+        samples = np.concatenate(
+            list(audio_clip.iter_chunks(fps=fps, chunksize=50000))
+        ).astype(np.float32, copy=False)
+        if samples.ndim == 1:
+            samples = samples[:, None]
+        tracks.append(samples)
+    
+    length = max(len(samples) for samples in tracks)
+    nchannels = max(samples.shape[1] for samples in tracks)
+    mix = np.zeros((length, nchannels), dtype=np.float32)
+    for samples in tracks:
+        mix[:len(samples)] += samples
+    np.clip(mix, -1.0, 1.0, out=mix)
+    
+    def make_frame(t):
+        indices = np.rint(np.asarray(t) * fps).astype(int)
+        in_range = (indices >= 0) & (indices < length)
+        frame = mix[np.where(in_range, indices, 0)]
+        return np.where(in_range[..., None], frame, 0.0)
+    
+    return AudioClip(make_frame, duration=length / fps, fps=fps)
+
+
 def mix_audio_tracks(
     voice_audio,
     bgm_audio=None,
@@ -2704,6 +3286,8 @@ def mix_audio_tracks(
     Raises:
         ValueError: 如果参数不在有效范围内
     """
+    from moviepy.editor import CompositeAudioClip, afx
+    
     # 验证参数
     validate_bgm_volume(bgm_volume)
     validate_bgm_fade_in(bgm_fade_in)
@@ -2734,8 +3318,8 @@ def mix_audio_tracks(
                 voice = voice.subclip(0, target_duration)
         audio_clips.append(voice)
     
-    # 处理 BGM（背景音轨）
-    if bgm_audio is not None:
+    # 处理 BGM（背景音轨），音量为 0 时听不到，跳过循环、淡入淡出和混合
+    if bgm_audio is not None and bgm_volume > 0:
         bgm = bgm_audio
         
         # 调整 BGM 时长以匹配目标时长
@@ -2759,10 +3343,258 @@ def mix_audio_tracks(
         return None
     elif len(audio_clips) == 1:
         return audio_clips[0]
+    elif final_duration <= _AUDIO_ARRAY_MIX_MAX_DURATION:
+        # 短音频直接按采样相加，避免合成时逐块回调各子片段
+        return _mix_audio_arrays(audio_clips)
     else:
         return CompositeAudioClip(audio_clips)
 
 
+# ============================================================
+# 视频导出 (Requirements 6.9)
+# ============================================================
+
+def write_video_pipelined(
+    clip,
+    output_path: str,
+    fps: int,
+    codec: str = "libx264",
+    audio_codec: str = "aac",
+    bitrate: Optional[str] = None,
+    preset: str = "medium",
+    threads: Optional[int] = None,
+    prefetch: int = 8,
+) -> None:
+    """
+    以流水线方式导出视频：后台线程合成帧，当前线程写入 FFmpeg
+    
+    与 clip.write_videofile 的输出相同（先写临时音频文件，再由 FFmpeg
+    编码视频并混入音频），但帧合成（解码、转场、滤镜）与编码写入通过
+    有界队列重叠执行，而不是逐帧串行。
+    
+    Args:
+        clip: 要导出的视频片段
+        output_path: 输出文件路径
+        fps: 输出帧率
+        codec: 视频编码器
+        audio_codec: 音频编码器
+        bitrate: 视频码率
+        preset: FFmpeg 编码预设
+        threads: FFmpeg 编码线程数
+        prefetch: 预先合成的最大帧数
+    """
+    import queue
+    from moviepy.tools import find_extension
+    from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+    
+    audiofile = None
+    if clip.audio is not None:
+        audiofile = f"{os.path.splitext(output_path)[0]}_TEMP_wvf_snd.{find_extension(audio_codec)}"
+        clip.audio.write_audiofile(
+            audiofile, fps=_AUDIO_MIX_FPS, nbytes=4, buffersize=2000,
+            codec=audio_codec, verbose=False, logger=None
+        )
+    
+    frames = queue.Queue(maxsize=prefetch)
+    end_of_frames = object()
+    stop = threading.Event()
+    errors = []
+    
+    def produce_frames():
+        """逐帧合成并放入队列，出错时记录异常"""
+        try:
+            for frame in clip.iter_frames(fps=fps, dtype="uint8"):
+                if stop.is_set():
+                    return
+                frames.put(frame)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            frames.put(end_of_frames)
+    
+    producer = threading.Thread(target=produce_frames, name="video-frame-producer", daemon=True)
+    producer.start()
+    
+    try:
+        with FFMPEG_VideoWriter(
+            output_path, clip.size, fps, codec=codec, preset=preset,
+            bitrate=bitrate, audiofile=audiofile, threads=threads
+        ) as writer:
+            while True:
+                frame = frames.get()
+                if frame is end_of_frames:
+                    break
+                writer.write_frame(frame)
+        
+        if errors:
+            raise errors[0]
+    finally:
+        # 写入失败时让合成线程尽快退出，并清空队列避免其阻塞
+        stop.set()
+        while producer.is_alive():
+            try:
+                frames.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        if audiofile and os.path.exists(audiofile):
+            os.remove(audiofile)
+
+
+# ============================================================
+# 渲染配置 (Requirements 5.5, 6.1, 6.4, 6.8, 10.1, 10.2, 10.3)
+# ============================================================
+
+@dataclass(frozen=True, slots=True)
+class RenderConfig:
+    """
+    视频渲染参数
+    
+    由 from_request 从请求配置字典中一次性解析并校验，
+    渲染过程中直接读取属性，不再反复 dict.get 查默认值。
+    """
+    # 视频配置
+    resolution: str = VIDEO_RESOLUTION_DEFAULT
+    layout: str = VIDEO_LAYOUT_DEFAULT
+    fps: int = VIDEO_FPS_DEFAULT
+    size: Tuple[int, int] = calculate_video_size(VIDEO_RESOLUTION_DEFAULT, VIDEO_LAYOUT_DEFAULT)
+    fit_mode: str = FIT_MODE_DEFAULT
+    
+    # 转场配置
+    transition_enabled: bool = True
+    transition_type: str = TRANSITION_TYPE_DEFAULT
+    transition_duration: float = TRANSITION_DURATION_DEFAULT
+    
+    # 特效和调节参数
+    effect_type: Optional[str] = "none"
+    color_filter: str = COLOR_FILTER_DEFAULT
+    brightness: float = BRIGHTNESS_DEFAULT
+    contrast: float = CONTRAST_DEFAULT
+    saturation: float = SATURATION_DEFAULT
+    
+    # 片段配置
+    clip_min_duration: float = CLIP_MIN_DURATION_DEFAULT
+    clip_max_duration: float = CLIP_MAX_DURATION_DEFAULT
+    
+    # 字幕配置
+    subtitle_enabled: bool = True
+    subtitle_font: str = "SimHei"
+    subtitle_size: int = SUBTITLE_SIZE_DEFAULT
+    subtitle_color: str = "white"
+    subtitle_stroke_color: str = "black"
+    subtitle_stroke_width: float = 2
+    subtitle_position: str = SUBTITLE_POSITION_DEFAULT
+    
+    # BGM 配置
+    bgm_volume: float = BGM_VOLUME_DEFAULT
+    bgm_fade_in: float = BGM_FADE_IN_DEFAULT
+    bgm_fade_out: float = BGM_FADE_OUT_DEFAULT
+    
+    # 输出配置
+    output_quality: str = OUTPUT_QUALITY_DEFAULT
+    
+    @classmethod
+    def from_request(cls, config: Dict) -> "RenderConfig":
+        """
+        从请求配置字典解析渲染参数
+        
+        缺失的参数和无效的枚举值使用字段默认值，数值参数限制在有效范围内。
+        
+        Args:
+            config: create_video_from_config 接收的配置字典
+        
+        Returns:
+            RenderConfig 实例
+        """
+        defaults = _dataclass_defaults(cls)
+        
+        # 获取视频尺寸 (Requirements 5.5)
+        # 优先使用平台预设，否则使用分辨率和布局计算
+        platform_preset = config.get("platform_preset")
+        if platform_preset and platform_preset in PLATFORM_PRESETS:
+            preset = PLATFORM_PRESETS[platform_preset]
+            resolution = preset["resolution"]
+            layout = preset["layout"]
+            fps = preset["fps"]
+        else:
+            resolution = config.get("video_resolution", defaults["resolution"])
+            layout = config.get("video_layout", defaults["layout"])
+            fps = config.get("video_fps", defaults["fps"])
+        
+        try:
+            size = calculate_video_size(resolution, layout)
+        except ValueError:
+            # 回退到旧的尺寸获取方式
+            old_layout = "portrait" if layout in ["9:16", "3:4"] else "landscape"
+            size = get_video_size(resolution, old_layout)
+        
+        # 获取素材适配模式 (Requirements 6.1)
+        fit_mode = config.get("fit_mode", defaults["fit_mode"])
+        if fit_mode not in FIT_MODES:
+            fit_mode = defaults["fit_mode"]
+        
+        # 获取并验证转场配置 (Requirements 6.4)
+        transition_type = config.get("transition_type", defaults["transition_type"])
+        transition_duration = config.get("transition_duration", defaults["transition_duration"])
+        if transition_type not in TRANSITIONS:
+            transition_type = defaults["transition_type"]
+        if transition_duration < TRANSITION_DURATION_MIN or transition_duration > TRANSITION_DURATION_MAX:
+            transition_duration = defaults["transition_duration"]
+        
+        # 获取并验证特效配置 (Requirements 10.1, 10.2)
+        effect_type = config.get("effect_type", defaults["effect_type"])
+        color_filter = config.get("color_filter", defaults["color_filter"])
+        if effect_type and effect_type not in EFFECT_TYPES:
+            effect_type = defaults["effect_type"]
+        if color_filter not in COLOR_FILTERS:
+            color_filter = defaults["color_filter"]
+        
+        subtitle_config = config.get("subtitle_config") or {}
+        subtitle_position = subtitle_config.get("position", defaults["subtitle_position"])
+        if subtitle_position not in _SUBTITLE_POSITION_SET:
+            subtitle_position = defaults["subtitle_position"]
+        
+        output_quality = config.get("output_quality", defaults["output_quality"])
+        if output_quality not in _OUTPUT_QUALITY_SET:
+            output_quality = defaults["output_quality"]
+        
+        return cls(
+            resolution=resolution,
+            layout=layout,
+            fps=fps,
+            size=size,
+            fit_mode=fit_mode,
+            transition_enabled=config.get("transition_enabled", defaults["transition_enabled"]),
+            transition_type=transition_type,
+            transition_duration=transition_duration,
+            effect_type=effect_type,
+            color_filter=color_filter,
+            # 验证调节参数范围 (Requirements 10.3)
+            brightness=max(BRIGHTNESS_MIN, min(BRIGHTNESS_MAX, config.get("brightness", defaults["brightness"]))),
+            contrast=max(CONTRAST_MIN, min(CONTRAST_MAX, config.get("contrast", defaults["contrast"]))),
+            saturation=max(SATURATION_MIN, min(SATURATION_MAX, config.get("saturation", defaults["saturation"]))),
+            clip_min_duration=config.get("clip_min_duration", defaults["clip_min_duration"]),
+            clip_max_duration=config.get("clip_max_duration", defaults["clip_max_duration"]),
+            subtitle_enabled=config.get("subtitle_enabled", defaults["subtitle_enabled"]),
+            subtitle_font=subtitle_config.get("font", defaults["subtitle_font"]),
+            subtitle_size=subtitle_config.get("size", defaults["subtitle_size"]),
+            subtitle_color=subtitle_config.get("color", defaults["subtitle_color"]),
+            subtitle_stroke_color=subtitle_config.get("stroke_color", defaults["subtitle_stroke_color"]),
+            subtitle_stroke_width=subtitle_config.get("stroke_width", defaults["subtitle_stroke_width"]),
+            subtitle_position=subtitle_position,
+            # 验证 BGM 参数范围 (Requirements 6.8)
+            bgm_volume=max(BGM_VOLUME_MIN, min(BGM_VOLUME_MAX, config.get("bgm_volume", defaults["bgm_volume"]))),
+            bgm_fade_in=max(BGM_FADE_IN_MIN, min(BGM_FADE_IN_MAX, config.get("bgm_fade_in", defaults["bgm_fade_in"]))),
+            bgm_fade_out=max(BGM_FADE_OUT_MIN, min(BGM_FADE_OUT_MAX, config.get("bgm_fade_out", defaults["bgm_fade_out"]))),
+            output_quality=output_quality,
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_defaults(cls) -> Dict:
+    """数据类各字段的默认值（slots 数据类的类属性不保留默认值，需从 fields 读取）"""
+    return {f.name: f.default for f in fields(cls)}
+
+
 def create_video_from_config(config: Dict, progress_callback=None) -> str:
     """
     根据配置生成视频 (Requirements 5.5, 6.1, 6.4, 6.8, 10.1, 10.2, 10.3)
@@ -2794,6 +3626,12 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     - saturation: 饱和度调节 (Requirements 10.3)
     - output_path: 输出路径
     """
+    from moviepy.editor import (
+        VideoFileClip, AudioFileClip, ImageClip, ColorClip,
+        CompositeVideoClip, concatenate_videoclips
+    )
+    _ensure_pil_compat()
+    
     
     def update_progress(percent: int, message: str):
         if progress_callback:
@@ -2801,60 +3639,19 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     
     update_progress(5, "正在解析配置...")
     
-    # 获取视频尺寸 (Requirements 5.5)
-    # 优先使用平台预设，否则使用分辨率和布局计算
-    platform_preset = config.get("platform_preset")
-    if platform_preset and platform_preset in PLATFORM_PRESETS:
-        preset = PLATFORM_PRESETS[platform_preset]
-        resolution = preset["resolution"]
-        layout = preset["layout"]
-        fps = preset["fps"]
-    else:
-        resolution = config.get("video_resolution", "1080p")
-        layout = config.get("video_layout", "9:16")
-        fps = config.get("video_fps", 30)
-    
-    # 使用新的尺寸计算函数 (Requirements 5.5)
-    try:
-        size = calculate_video_size(resolution, layout)
-    except ValueError:
-        # 回退到旧的尺寸获取方式
-        old_layout = "portrait" if layout in ["9:16", "3:4"] else "landscape"
-        size = get_video_size(resolution, old_layout)
-    
-    # 获取素材适配模式 (Requirements 6.1)
-    fit_mode = config.get("fit_mode", "crop")
-    if fit_mode not in FIT_MODES:
-        fit_mode = "crop"
-    
-    # 获取转场配置 (Requirements 6.4)
-    transition_enabled = config.get("transition_enabled", True)
-    transition_type = config.get("transition_type", "fade")
-    transition_duration = config.get("transition_duration", TRANSITION_DURATION_DEFAULT)
-    
-    # 验证转场配置
-    if transition_type not in TRANSITIONS:
-        transition_type = "fade"
-    if transition_duration < TRANSITION_DURATION_MIN or transition_duration > TRANSITION_DURATION_MAX:
-        transition_duration = TRANSITION_DURATION_DEFAULT
-    
-    # 获取视频特效配置 (Requirements 10.1, 10.2, 10.3)
-    effect_type = config.get("effect_type", "none")
-    color_filter = config.get("color_filter", "none")
-    brightness = config.get("brightness", BRIGHTNESS_DEFAULT)
-    contrast = config.get("contrast", CONTRAST_DEFAULT)
-    saturation = config.get("saturation", SATURATION_DEFAULT)
-    
-    # 验证特效配置
-    if effect_type and effect_type not in EFFECT_TYPES:
-        effect_type = "none"
-    if color_filter not in COLOR_FILTERS:
-        color_filter = "none"
-    
-    # 验证调节参数范围
-    brightness = max(BRIGHTNESS_MIN, min(BRIGHTNESS_MAX, brightness))
-    contrast = max(CONTRAST_MIN, min(CONTRAST_MAX, contrast))
-    saturation = max(SATURATION_MIN, min(SATURATION_MAX, saturation))
+    # 一次性解析并校验渲染参数
+    cfg = RenderConfig.from_request(config)
+    size = cfg.size
+    fps = cfg.fps
+    fit_mode = cfg.fit_mode
+    transition_enabled = cfg.transition_enabled
+    transition_type = cfg.transition_type
+    transition_duration = cfg.transition_duration
+    effect_type = cfg.effect_type
+    color_filter = cfg.color_filter
+    brightness = cfg.brightness
+    contrast = cfg.contrast
+    saturation = cfg.saturation
     
     # 加载配音（作为旁白，不决定视频时长）
     update_progress(10, "正在加载配音...")
@@ -2872,8 +3669,8 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     media_files = config.get("media_files", [])
     
     # 片段时长由配置决定
-    min_dur = config.get("clip_min_duration", 3.0)
-    max_dur = config.get("clip_max_duration", 10.0)
+    min_dur = cfg.clip_min_duration
+    max_dur = cfg.clip_max_duration
     clip_duration = (min_dur + max_dur) / 2  # 使用平均值
     
     # 确定片段数量：取素材数量和句子数量的最大值，至少为1
@@ -2891,22 +3688,77 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     
     # 创建视频片段
     update_progress(30, "正在生成视频片段...")
-    video_clips = []
     
-    for i in range(num_clips):
+    # 特效、滤镜、调节参数对所有片段相同，在循环外确定需要的处理步骤
+    apply_effect = bool(effect_type) and effect_type != "none"
+    segment_steps = []
+    if color_filter and color_filter != "none":
+        # 颜色滤镜 (Requirements 10.2)
+        segment_steps.append(functools.partial(apply_color_filter, filter_type=color_filter))
+    if brightness != 1.0 or contrast != 1.0 or saturation != 1.0:
+        # 亮度/对比度/饱和度调节 (Requirements 10.3)，RenderConfig 已将参数限制在有效范围内
+        segment_steps.append(functools.partial(
+            _apply_video_adjustments_unchecked,
+            brightness=brightness, contrast=contrast, saturation=saturation
+        ))
+    
+    # 按图片路径缓存处理好的片段（素材少于片段数时图片会循环使用）
+    image_segments = {}
+    segment_cache_lock = threading.Lock()
+    
+    # 片段依次播放（无转场）时，同一视频文件的片段共用一个 VideoFileClip，
+    # 避免每个片段都启动 FFmpeg 探测和解码进程；有转场时相邻片段同时播放，
+    # 共用读取器会在两个位置间来回定位，因此每个片段仍单独打开
+    share_video_sources = not (transition_enabled and transition_type != "none")
+    video_sources = {}
+    
+    # 每个视频读取器一把锁：subclip、resize、fl_image 都会调用 get_frame(0) 读取帧，
+    # 同一个 FFMPEG_VideoReader 不能被多个线程同时定位和读取，使用它的片段串行构建
+    video_source_locks = {}
+    
+    # 素材类型只取决于扩展名，每个素材判断一次
+    media_entries = [
+        (media_path, os.path.splitext(media_path)[1].lower() not in ALLOWED_VIDEO_EXTENSIONS)
+        for media_path in media_files
+    ]
+    
+    def build_segment(i: int):
+        """生成第 i 个视频片段；图片和纯色片段可并行准备，视频片段按读取器加锁"""
+        if media_files:
+            media_path, is_image = media_entries[i % len(media_entries)]
+            if not is_image:
+                source_key = media_path if share_video_sources else i
+                with segment_cache_lock:
+                    source_lock = video_source_locks.setdefault(source_key, threading.Lock())
+                with source_lock:
+                    return prepare_segment(i)
+        return prepare_segment(i)
+    
+    def prepare_segment(i: int):
+        """生成第 i 个视频片段"""
         # 计算当前片段时长
         seg_duration = clip_duration
         
         if seg_duration <= 0:
-            continue
+            return None
         
         # 选择素材（循环使用）(Requirements 6.3)
         if media_files:
-            media_path = media_files[i % len(media_files)]
-            ext = os.path.splitext(media_path)[1].lower()
+            media_path, is_image = media_entries[i % len(media_entries)]
             
-            if ext in ALLOWED_VIDEO_EXTENSIONS:
-                clip = VideoFileClip(media_path)
+            # 同一图片的片段处理结果完全相同，直接复用
+            if is_image:
+                with segment_cache_lock:
+                    cached = image_segments.get(media_path)
+                if cached is not None:
+                    return cached
+            
+            if not is_image:
+                # 调用方已持有该读取器的锁
+                source_key = media_path if share_video_sources else i
+                clip = video_sources.get(source_key)
+                if clip is None:
+                    clip = video_sources[source_key] = VideoFileClip(media_path)
                 # 如果视频比需要的短，循环播放
                 if clip.duration < seg_duration:
                     clip = clip.loop(duration=seg_duration)
@@ -2920,7 +3772,7 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
                 clip = ImageClip(media_path, duration=seg_duration)
                 
                 # 对图片应用特效 (Requirements 10.1)
-                if effect_type and effect_type != "none":
+                if apply_effect:
                     try:
                         clip = apply_video_effect(clip, effect_type, seg_duration)
                     except Exception:
@@ -2936,23 +3788,26 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
                 duration=seg_duration
             )
         
-        # 应用颜色滤镜 (Requirements 10.2)
-        if color_filter and color_filter != "none":
-            try:
-                clip = apply_color_filter(clip, color_filter)
-            except Exception:
-                pass  # 滤镜应用失败时继续使用原片段
-        
-        # 应用亮度/对比度/饱和度调节 (Requirements 10.3)
-        if brightness != 1.0 or contrast != 1.0 or saturation != 1.0:
+        # 应用颜色滤镜和亮度/对比度/饱和度调节
+        for step in segment_steps:
             try:
-                clip = apply_video_adjustments(clip, brightness, contrast, saturation)
+                clip = step(clip)
             except Exception:
-                pass  # 调节应用失败时继续使用原片段
+                pass  # 滤镜/调节应用失败时继续使用原片段
         
-        video_clips.append(clip)
+        if media_files and is_image:
+            with segment_cache_lock:
+                clip = image_segments.setdefault(media_path, clip)
         
-        update_progress(30 + int(25 * (i + 1) / num_clips), f"处理片段 {i + 1}/{num_clips}")
+        return clip
+    
+    # 并行打开、解码和适配素材；按顺序收集结果，进度回调仍在当前线程中调用
+    video_clips = []
+    with ThreadPoolExecutor(max_workers=min(num_clips, os.cpu_count() or 1)) as executor:
+        for i, clip in enumerate(executor.map(build_segment, range(num_clips))):
+            if clip is not None:
+                video_clips.append(clip)
+            update_progress(30 + int(25 * (i + 1) / num_clips), f"处理片段 {i + 1}/{num_clips}")
     
     # 应用转场效果并合成视频 (Requirements 6.4)
     update_progress(55, "正在应用转场效果...")
@@ -2982,10 +3837,11 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     actual_duration = final_video.duration
     
     # 添加字幕
-    if config.get("subtitle_enabled", True) and sentences[0]:
+    if cfg.subtitle_enabled and sentences[0]:
         update_progress(65, "正在添加字幕...")
-        subtitle_config = config.get("subtitle_config", {})
         subtitle_clips = []
+        # 句子循环使用时相同字幕只渲染一次；缓存随本次生成结束释放
+        text_cache = {}
         
         # 检查是否有精准字幕时间戳
         sentence_subtitles = config.get("sentence_subtitles", [])
@@ -3014,12 +3870,13 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
                     sub["text"],
                     sub_duration,
                     size,
-                    font=subtitle_config.get("font", "SimHei"),
-                    fontsize=subtitle_config.get("size", 48),
-                    color=subtitle_config.get("color", "white"),
-                    stroke_color=subtitle_config.get("stroke_color", "black"),
-                    stroke_width=subtitle_config.get("stroke_width", 2),
-                    position=subtitle_config.get("position", "bottom")
+                    font=cfg.subtitle_font,
+                    fontsize=cfg.subtitle_size,
+                    color=cfg.subtitle_color,
+                    stroke_color=cfg.subtitle_stroke_color,
+                    stroke_width=cfg.subtitle_stroke_width,
+                    position=cfg.subtitle_position,
+                    text_cache=text_cache
                 )
                 txt_clip = txt_clip.set_start(sub_start)
                 subtitle_clips.append(txt_clip)
@@ -3051,12 +3908,13 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
                     sentence,
                     seg_duration,
                     size,
-                    font=subtitle_config.get("font", "SimHei"),
-                    fontsize=subtitle_config.get("size", 48),
-                    color=subtitle_config.get("color", "white"),
-                    stroke_color=subtitle_config.get("stroke_color", "black"),
-                    stroke_width=subtitle_config.get("stroke_width", 2),
-                    position=subtitle_config.get("position", "bottom")
+                    font=cfg.subtitle_font,
+                    fontsize=cfg.subtitle_size,
+                    color=cfg.subtitle_color,
+                    stroke_color=cfg.subtitle_stroke_color,
+                    stroke_width=cfg.subtitle_stroke_width,
+                    position=cfg.subtitle_position,
+                    text_cache=text_cache
                 )
                 txt_clip = txt_clip.set_start(current_time)
                 subtitle_clips.append(txt_clip)
@@ -3073,23 +3931,13 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     if config.get("bgm_path") and os.path.exists(config["bgm_path"]):
         bgm_audio = AudioFileClip(config["bgm_path"])
     
-    # 获取 BGM 配置 (Requirements 6.8)
-    bgm_volume = config.get("bgm_volume", BGM_VOLUME_DEFAULT)
-    bgm_fade_in = config.get("bgm_fade_in", BGM_FADE_IN_DEFAULT)
-    bgm_fade_out = config.get("bgm_fade_out", BGM_FADE_OUT_DEFAULT)
-    
-    # 验证 BGM 配置范围
-    bgm_volume = max(BGM_VOLUME_MIN, min(BGM_VOLUME_MAX, bgm_volume))
-    bgm_fade_in = max(BGM_FADE_IN_MIN, min(BGM_FADE_IN_MAX, bgm_fade_in))
-    bgm_fade_out = max(BGM_FADE_OUT_MIN, min(BGM_FADE_OUT_MAX, bgm_fade_out))
-    
     # 使用音频混合函数 (Requirements 6.6, 6.7, 6.8)
     final_audio = mix_audio_tracks(
         voice_audio=voice_audio,
         bgm_audio=bgm_audio,
-        bgm_volume=bgm_volume,
-        bgm_fade_in=bgm_fade_in,
-        bgm_fade_out=bgm_fade_out,
+        bgm_volume=cfg.bgm_volume,
+        bgm_fade_in=cfg.bgm_fade_in,
+        bgm_fade_out=cfg.bgm_fade_out,
         target_duration=actual_duration
     )
     
@@ -3101,7 +3949,7 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     output_path = config.get("output_path", "output.mp4")
     
     # 根据输出质量配置码率
-    output_quality = config.get("output_quality", "high")
+    output_quality = cfg.output_quality
     bitrate_map = {
         "low": "2000k",
         "medium": "5000k",
@@ -3110,16 +3958,15 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
     }
     bitrate = bitrate_map.get(output_quality, "8000k")
     
-    final_video.write_videofile(
+    write_video_pipelined(
+        final_video,
         output_path,
         fps=fps,
         codec="libx264",
         audio_codec="aac",
         bitrate=bitrate,
         threads=4,
-        preset="medium",
-        verbose=False,
-        logger=None
+        preset="medium"
     )
     
     # 清理资源
@@ -3128,7 +3975,7 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
         voice_audio.close()
     if bgm_audio:
         bgm_audio.close()
-    for clip in video_clips:
+    for clip in video_clips + list(video_sources.values()):
         try:
             clip.close()
         except Exception:
@@ -3146,6 +3993,18 @@ def create_video_from_config(config: Dict, progress_callback=None) -> str:
 import uuid
 import re as regex_module
 
+# UUID v4 格式正则表达式
+_UUID_V4_RE = regex_module.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
+    regex_module.IGNORECASE
+)
+
+# 通用 UUID 格式正则表达式（接受任何版本）
+_UUID_ANY_RE = regex_module.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    regex_module.IGNORECASE
+)
+
 
 def generate_task_id() -> str:
     """
@@ -3172,13 +4031,11 @@ def is_valid_uuid(task_id: str) -> bool:
     if not task_id or not isinstance(task_id, str):
         return False
     
-    # UUID v4 格式正则表达式
-    uuid_pattern = regex_module.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$',
-        regex_module.IGNORECASE
-    )
+    # 长度不对的输入无需进入正则匹配
+    if len(task_id) != 36:
+        return False
     
-    return bool(uuid_pattern.match(task_id))
+    return bool(_UUID_V4_RE.match(task_id))
 
 
 def is_valid_uuid_format(task_id: str) -> bool:
@@ -3196,13 +4053,11 @@ def is_valid_uuid_format(task_id: str) -> bool:
     if not task_id or not isinstance(task_id, str):
         return False
     
-    # 通用 UUID 格式正则表达式（接受任何版本）
-    uuid_pattern = regex_module.compile(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-        regex_module.IGNORECASE
-    )
+    # 长度不对的输入无需进入正则匹配
+    if len(task_id) != 36:
+        return False
     
-    return bool(uuid_pattern.match(task_id))
+    return bool(_UUID_ANY_RE.match(task_id))
 
 
 # 任务状态常量
@@ -3218,6 +4073,10 @@ TASK_STATUS_NAMES = {
     TASK_STATUS_COMPLETED: "completed",
     TASK_STATUS_FAILED: "failed",
 }
+_TASK_STATUS_NAME_SET = frozenset(TASK_STATUS_NAMES.values())
+
+# 响应字典中缺失字段的标记（与值为 None 的字段区分）
+_MISSING = object()
 
 
 def get_task_status_name(status_code: int) -> str:
@@ -3233,42 +4092,20 @@ def get_task_status_name(status_code: int) -> str:
     return TASK_STATUS_NAMES.get(status_code, "unknown")
 
 
+@dataclass(frozen=True, slots=True)
 class TaskStatusResponse:
     """
     任务状态响应类 (Requirements 8.3, 8.5, 8.6)
     
     封装任务状态查询的完整响应信息。
     """
-    
-    def __init__(
-        self,
-        status: str,
-        progress: int,
-        message: str,
-        download_url: Optional[str] = None,
-        error_message: Optional[str] = None,
-        duration: Optional[float] = None,
-        task_id: Optional[str] = None
-    ):
-        """
-        初始化任务状态响应
-        
-        Args:
-            status: 状态名称 (pending, processing, completed, failed)
-            progress: 进度百分比 (0-100)
-            message: 状态消息
-            download_url: 下载链接（仅完成状态）
-            error_message: 错误信息（仅失败状态）
-            duration: 视频时长（仅完成状态）
-            task_id: 任务 ID
-        """
-        self.status = status
-        self.progress = progress
-        self.message = message
-        self.download_url = download_url
-        self.error_message = error_message
-        self.duration = duration
-        self.task_id = task_id
+    status: str  # 状态名称 (pending, processing, completed, failed)
+    progress: int  # 进度百分比 (0-100)
+    message: str  # 状态消息
+    download_url: Optional[str] = None  # 下载链接（仅完成状态）
+    error_message: Optional[str] = None  # 错误信息（仅失败状态）
+    duration: Optional[float] = None  # 视频时长（仅完成状态）
+    task_id: Optional[str] = None  # 任务 ID
     
     def to_dict(self) -> Dict:
         """
@@ -3281,29 +4118,97 @@ class TaskStatusResponse:
         Returns:
             包含完整状态信息的字典
         """
-        result = {
-            "status": self.status,
-            "progress": self.progress,
-            "message": self.message,
-        }
-        
-        # 添加任务 ID（如果有）
-        if self.task_id:
-            result["task_id"] = self.task_id
-        
-        # 完成状态返回 download_url (Requirements 8.5)
-        if self.status == "completed":
-            if self.download_url:
-                result["download_url"] = self.download_url
-            if self.duration is not None:
-                result["duration"] = self.duration
-        
-        # 失败状态返回 error_message (Requirements 8.6)
-        if self.status == "failed":
-            if self.error_message:
-                result["error_message"] = self.error_message
-        
-        return result
+        return _task_status_dict(
+            self.status, self.progress, self.message, self.task_id,
+            self.download_url, self.error_message, self.duration,
+        )
+
+
+def _add_completed_status_fields(
+    result: Dict,
+    download_url: Optional[str],
+    error_message: Optional[str],
+    duration: Optional[float]
+) -> None:
+    """完成状态返回 download_url 和 duration (Requirements 8.5)"""
+    if download_url:
+        result["download_url"] = download_url
+    if duration is not None:
+        result["duration"] = duration
+
+
+def _add_failed_status_fields(
+    result: Dict,
+    download_url: Optional[str],
+    error_message: Optional[str],
+    duration: Optional[float]
+) -> None:
+    """失败状态返回 error_message (Requirements 8.6)"""
+    if error_message:
+        result["error_message"] = error_message
+
+
+# 状态名称到额外字段填充函数的分派表（pending/processing 没有额外字段）
+_TASK_STATUS_DICT_FIELDS = {
+    "completed": _add_completed_status_fields,
+    "failed": _add_failed_status_fields,
+}
+
+
+def _task_status_dict(
+    status: str,
+    progress: int,
+    message: str,
+    task_id: Optional[str],
+    download_url: Optional[str],
+    error_message: Optional[str],
+    duration: Optional[float]
+) -> Dict:
+    """构建状态响应字典，TaskStatusResponse.to_dict 和 build_task_status_dict 共用"""
+    result = {
+        "status": status,
+        "progress": progress,
+        "message": message,
+    }
+    
+    # 添加任务 ID（如果有）
+    if task_id:
+        result["task_id"] = task_id
+    
+    # 只有完成和失败状态有额外字段，按状态分派
+    add_status_fields = _TASK_STATUS_DICT_FIELDS.get(status)
+    if add_status_fields is not None:
+        add_status_fields(result, download_url, error_message, duration)
+    
+    return result
+
+
+# 各状态的默认消息
+_TASK_STATUS_DEFAULT_MESSAGES = {
+    TASK_STATUS_PENDING: "等待处理...",
+    TASK_STATUS_PROCESSING: "正在处理...",
+    TASK_STATUS_COMPLETED: "视频生成完成",
+    TASK_STATUS_FAILED: "视频生成失败",
+}
+
+
+def _normalize_task_progress(
+    status_code: int,
+    progress: int,
+    progress_message: Optional[str]
+) -> Tuple[int, str]:
+    """限制进度范围并补全默认消息；完成状态进度为 100，失败状态为 0"""
+    if status_code == TASK_STATUS_COMPLETED:
+        progress = 100
+    elif status_code == TASK_STATUS_FAILED:
+        progress = 0
+    else:
+        progress = max(0, min(100, progress))
+    
+    if not progress_message:
+        progress_message = _TASK_STATUS_DEFAULT_MESSAGES.get(status_code, "未知状态")
+    
+    return progress, progress_message
 
 
 def build_task_status_response(
@@ -3332,31 +4237,10 @@ def build_task_status_response(
     Returns:
         TaskStatusResponse 对象
     """
-    status_name = get_task_status_name(status_code)
-    
-    # 确保进度在有效范围内
-    progress = max(0, min(100, progress))
-    
-    # 根据状态设置默认消息
-    if not progress_message:
-        default_messages = {
-            TASK_STATUS_PENDING: "等待处理...",
-            TASK_STATUS_PROCESSING: "正在处理...",
-            TASK_STATUS_COMPLETED: "视频生成完成",
-            TASK_STATUS_FAILED: "视频生成失败",
-        }
-        progress_message = default_messages.get(status_code, "未知状态")
-    
-    # 完成状态强制设置进度为 100
-    if status_code == TASK_STATUS_COMPLETED:
-        progress = 100
-    
-    # 失败状态强制设置进度为 0
-    if status_code == TASK_STATUS_FAILED:
-        progress = 0
+    progress, progress_message = _normalize_task_progress(status_code, progress, progress_message)
     
     return TaskStatusResponse(
-        status=status_name,
+        status=get_task_status_name(status_code),
         progress=progress,
         message=progress_message,
         download_url=download_url if status_code == TASK_STATUS_COMPLETED else None,
@@ -3366,6 +4250,35 @@ def build_task_status_response(
     )
 
 
+def build_task_status_dict(
+    status_code: int,
+    progress: int,
+    progress_message: Optional[str] = None,
+    error_message: Optional[str] = None,
+    download_url: Optional[str] = None,
+    duration: Optional[float] = None,
+    task_id: Optional[str] = None
+) -> Dict:
+    """
+    直接构建任务状态响应字典 (Requirements 8.3, 8.5, 8.6)
+    
+    结果与 build_task_status_response(...).to_dict() 相同，
+    供只需要字典的状态查询接口使用，不创建中间的 TaskStatusResponse。
+    
+    Args:
+        参数同 build_task_status_response
+    
+    Returns:
+        包含完整状态信息的字典
+    """
+    progress, progress_message = _normalize_task_progress(status_code, progress, progress_message)
+    
+    return _task_status_dict(
+        get_task_status_name(status_code), progress, progress_message, task_id,
+        download_url, error_message, duration,
+    )
+
+
 def validate_task_status_response(response: Dict) -> Tuple[bool, List[str]]:
     """
     验证任务状态响应的完整性 (Requirements 8.3, 8.5, 8.6)
@@ -3387,22 +4300,25 @@ def validate_task_status_response(response: Dict) -> Tuple[bool, List[str]]:
     """
     errors = []
     
+    # 每个字段只查询一次，缺失时得到 _MISSING
+    status = response.get("status", _MISSING)
+    progress = response.get("progress", _MISSING)
+    message = response.get("message", _MISSING)
+    
     # 验证必要字段存在
-    if "status" not in response:
+    if status is _MISSING:
         errors.append("缺少 status 字段")
     
-    if "progress" not in response:
+    if progress is _MISSING:
         errors.append("缺少 progress 字段")
     
-    if "message" not in response:
+    if message is _MISSING:
         errors.append("缺少 message 字段")
     
     # 如果有基本字段，进行进一步验证
-    if "status" in response:
-        status = response["status"]
-        valid_statuses = ["pending", "processing", "completed", "failed"]
-        
-        if status not in valid_statuses:
+    if status is not _MISSING:
+        # 非字符串（可能不可哈希）的值直接判为无效，不做集合查找
+        if not isinstance(status, str) or status not in _TASK_STATUS_NAME_SET:
             errors.append(f"无效的 status 值: {status}")
         
         # 完成状态必须有 download_url (Requirements 8.5)
@@ -3413,13 +4329,11 @@ def validate_task_status_response(response: Dict) -> Tuple[bool, List[str]]:
         if status == "failed" and "error_message" not in response:
             errors.append("失败状态缺少 error_message 字段")
     
-    if "progress" in response:
-        progress = response["progress"]
+    if progress is not _MISSING:
         if not isinstance(progress, int) or progress < 0 or progress > 100:
             errors.append(f"progress 必须是 0-100 的整数，实际值: {progress}")
     
-    if "message" in response:
-        message = response["message"]
+    if message is not _MISSING:
         if not isinstance(message, str):
             errors.append(f"message 必须是字符串，实际类型: {type(message)}")
     
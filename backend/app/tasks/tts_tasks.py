@@ -1,21 +1,41 @@
+import asyncio
+import logging
 import os
+import threading
 import time
 from celery import current_task
 from app.core.celery_app import celery_app
 from app.core.database import SessionLocal
 from app.core.config import settings
 from app.models import TtsTask
+from app.services.tts_service import get_tts
+from app.services.edge_tts_service import generate_audio
+
+logger = logging.getLogger(__name__)
+
+# 每个工作进程（线程）复用一个事件循环，避免每次任务都由 asyncio.run 新建和销毁
+_loop_local = threading.local()
+
+
+def _run_async(coro):
+    """在当前工作线程的常驻事件循环中运行协程"""
+    loop = getattr(_loop_local, "loop", None)
+    # fork 出的子进程不能沿用父进程的事件循环
+    if loop is None or loop.is_closed() or _loop_local.pid != os.getpid():
+        loop = asyncio.new_event_loop()
+        _loop_local.loop = loop
+        _loop_local.pid = os.getpid()
+    return loop.run_until_complete(coro)
 
 
 @celery_app.task(bind=True)
 def run_tts_synthesis(self, task_id: str, text: str, language: str, upload_path: str, output_path: str, task_type: str = 'clone', voice: str = None):
     """执行 TTS 合成任务"""
     db = SessionLocal()
-    import asyncio
-
+    task_db = None
     
     try:
-        # 更新状态为处理中
+        # 更新状态为处理中（任务记录只查询一次，之后直接更新该对象）
         task_db = db.query(TtsTask).filter(TtsTask.task_id == task_id).first()
         if task_db:
             task_db.status = 1
@@ -26,7 +46,6 @@ def run_tts_synthesis(self, task_id: str, text: str, language: str, upload_path:
         
         if task_type == 'clone':
              # 加载 TTS 模型
-            from app.services.tts_service import get_tts
             tts = get_tts()
             
             self.update_state(state='PROCESSING', meta={'progress': 30, 'message': '正在分析参考音频...'})
@@ -46,13 +65,11 @@ def run_tts_synthesis(self, task_id: str, text: str, language: str, upload_path:
         elif task_type == 'tts':
             self.update_state(state='PROCESSING', meta={'progress': 30, 'message': '正在初始化语音服务...'})
             
-            from app.services.edge_tts_service import generate_audio
-            
             self.update_state(state='PROCESSING', meta={'progress': 50, 'message': '正在生成语音...'})
             
             start_time = time.time()
             # 运行异步生成
-            asyncio.run(generate_audio(
+            _run_async(generate_audio(
                 text=text,
                 voice=voice,
                 output_path=output_path
@@ -66,7 +83,6 @@ def run_tts_synthesis(self, task_id: str, text: str, language: str, upload_path:
         self.update_state(state='PROCESSING', meta={'progress': 90, 'message': '正在保存文件...'})
         
         # 更新数据库状态为完成
-        task_db = db.query(TtsTask).filter(TtsTask.task_id == task_id).first()
         if task_db:
             task_db.status = 2
             task_db.output_audio_url = output_path
@@ -81,10 +97,9 @@ def run_tts_synthesis(self, task_id: str, text: str, language: str, upload_path:
         }
         
     except Exception as e:
-        print(f"[Task {task_id[:8]}] 错误: {str(e)}")
+        logger.exception("[Task %s] 错误: %s", task_id[:8], e)
         
         # 更新数据库状态为失败
-        task_db = db.query(TtsTask).filter(TtsTask.task_id == task_id).first()
         if task_db:
             task_db.status = 3
             task_db.error_message = str(e)
@@ -94,6 +109,9 @@ def run_tts_synthesis(self, task_id: str, text: str, language: str, upload_path:
         
     finally:
         # 清理上传文件 (仅当存在且为Clone模式或者确认是临时文件时)
-        if upload_path and os.path.exists(upload_path) and task_type == 'clone':
-            os.remove(upload_path)
+        if upload_path and task_type == 'clone':
+            try:
+                os.remove(upload_path)
+            except FileNotFoundError:
+                pass
         db.close()
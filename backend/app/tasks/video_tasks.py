@@ -1,19 +1,29 @@
 """视频混剪 Celery 任务"""
+import logging
 import os
+import time
 from celery import current_task
 from app.core.celery_app import celery_app
 from app.core.database import SessionLocal
 from app.core.config import settings
 from app.models import VideoTask
 
+logger = logging.getLogger(__name__)
+
+# 进度写入数据库的节流：距上次提交超过间隔或进度前进足够多时才提交
+_PROGRESS_COMMIT_INTERVAL = 2.0  # 秒
+_PROGRESS_COMMIT_STEP = 5  # 百分比
+
 
 @celery_app.task(bind=True)
 def run_video_synthesis(self, task_id: str, config: dict):
     """执行视频混剪任务"""
     db = SessionLocal()
     
+    task_db = None
+    
     try:
-        # 更新状态为处理中
+        # 更新状态为处理中（任务记录只查询一次，之后直接更新该对象）
         task_db = db.query(VideoTask).filter(VideoTask.task_id == task_id).first()
         if task_db:
             task_db.status = 1
@@ -21,15 +31,26 @@ def run_video_synthesis(self, task_id: str, config: dict):
             task_db.progress_message = "任务开始..."
             db.commit()
         
+        last_commit_time = time.monotonic()
+        last_commit_percent = 5
+        
         def progress_callback(percent: int, message: str):
             """进度回调"""
+            nonlocal last_commit_time, last_commit_percent
             self.update_state(state='PROCESSING', meta={'progress': percent, 'message': message})
-            # 同时更新数据库
-            task = db.query(VideoTask).filter(VideoTask.task_id == task_id).first()
-            if task:
-                task.progress = percent
-                task.progress_message = message
-                db.commit()
+            # 同时更新数据库（节流，前端按固定间隔轮询，不需要每次回调都提交）
+            if task_db:
+                task_db.progress = percent
+                task_db.progress_message = message
+                now = time.monotonic()
+                if (
+                    percent >= 100
+                    or percent - last_commit_percent >= _PROGRESS_COMMIT_STEP
+                    or now - last_commit_time >= _PROGRESS_COMMIT_INTERVAL
+                ):
+                    db.commit()
+                    last_commit_time = now
+                    last_commit_percent = percent
         
         self.update_state(state='PROCESSING', meta={'progress': 10, 'message': '正在加载视频服务...'})
         
@@ -79,7 +100,6 @@ def run_video_synthesis(self, task_id: str, config: dict):
             duration = clip.duration
         
         # 更新数据库状态为完成
-        task_db = db.query(VideoTask).filter(VideoTask.task_id == task_id).first()
         if task_db:
             task_db.status = 2
             task_db.progress = 100
@@ -99,12 +119,9 @@ def run_video_synthesis(self, task_id: str, config: dict):
         }
         
     except Exception as e:
-        print(f"[Video Task {task_id[:8]}] 错误: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("[Video Task %s] 错误: %s", task_id[:8], e)
         
         # 更新数据库状态为失败
-        task_db = db.query(VideoTask).filter(VideoTask.task_id == task_id).first()
         if task_db:
             task_db.status = 3
             task_db.progress = 0
@@ -33,9 +33,8 @@ app.mount("/static/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="u
 app.mount("/static/outputs", StaticFiles(directory=settings.OUTPUT_DIR), name="outputs")
 
 
-@app.get("/", response_class=HTMLResponse)
-async def index():
-    """首页"""
+def _load_index_html() -> str:
+    """读取首页模板，模板不存在时返回默认页面"""
     template_path = os.path.join(os.path.dirname(__file__), "templates/demo.html")
     if os.path.exists(template_path):
         with open(template_path, "r", encoding="utf-8") as f:
@@ -43,6 +42,16 @@ async def index():
     return "<h1>Voice Synthesis API</h1><p>访问 <a href='/docs'>/docs</a> 查看API文档</p>"
 
 
+# 首页模板运行期间不会变化，启动时读取一次
+_INDEX_HTML = _load_index_html()
+
+
+@app.get("/", response_class=HTMLResponse)
+async def index():
+    """首页"""
+    return HTMLResponse(content=_INDEX_HTML)
+
+
 @app.get("/health")
 async def health():
     """健康检查"""
@@ -16,6 +16,7 @@ import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # ==================== 配置 ====================
 
@@ -91,10 +92,11 @@ def encrypt_code():
     ]
     
     print(f"执行命令: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # 不捕获输出，PyArmor 的进度和错误信息直接输出到终端
+    result = subprocess.run(cmd, check=False)
     
     if result.returncode != 0:
-        print(f"加密失败:\n{result.stderr}")
+        print(f"加密失败 (退出码 {result.returncode})")
         # 尝试 PyArmor 7.x 命令
         print("\n尝试 PyArmor 7.x 命令...")
         cmd_v7 = [
@@ -104,9 +106,9 @@ def encrypt_code():
             "--bind-device", TARGET_MACHINE_ID,
             f"{SOURCE_DIR}/__init__.py"
         ]
-        result = subprocess.run(cmd_v7, capture_output=True, text=True)
+        result = subprocess.run(cmd_v7, check=False)
         if result.returncode != 0:
-            print(f"加密失败:\n{result.stderr}")
+            print(f"加密失败 (退出码 {result.returncode})")
             return False
     
     print("加密成功!")
@@ -117,22 +119,37 @@ def copy_additional_files():
     """复制其他必要文件"""
     print("\n复制其他文件...")
     
-    for file in COPY_FILES:
-        if os.path.exists(file):
-            shutil.copy(file, OUTPUT_DIR)
-            print(f"  复制: {file}")
-    
-    for dir_name in COPY_DIRS:
-        if os.path.exists(dir_name):
-            shutil.copytree(dir_name, f"{OUTPUT_DIR}/{dir_name}")
-            print(f"  复制目录: {dir_name}")
+    # copytree 按顺序创建目录，文件复制交给线程池并行执行
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        copies = []
+        
+        def submit_copy(src, dst):
+            copies.append(executor.submit(shutil.copy2, src, dst))
+        
+        for file in COPY_FILES:
+            if os.path.exists(file):
+                submit_copy(file, OUTPUT_DIR)
+                print(f"  复制: {file}")
+        
+        for dir_name in COPY_DIRS:
+            if os.path.exists(dir_name):
+                shutil.copytree(
+                    dir_name, f"{OUTPUT_DIR}/{dir_name}",
+                    ignore=shutil.ignore_patterns(*EXCLUDE_PATTERNS),
+                    copy_function=submit_copy,
+                    dirs_exist_ok=True,
+                )
+                print(f"  复制目录: {dir_name}")
+        
+        # 等待全部复制完成，出错时抛出异常
+        for copy in copies:
+            copy.result()
     
     # 创建必要的空目录
     for dir_name in ["uploads", "outputs", "ai_models"]:
         os.makedirs(f"{OUTPUT_DIR}/{dir_name}", exist_ok=True)
         # 创建 .gitkeep
-        with open(f"{OUTPUT_DIR}/{dir_name}/.gitkeep", "w") as f:
-            pass
+        open(f"{OUTPUT_DIR}/{dir_name}/.gitkeep", "wb").close()
     
     print("文件复制完成!")
 
@@ -52,7 +52,7 @@ PROVIDERS = {
     },
 }
 
-async def test_provider(provider_id: str, config: dict) -> dict:
+async def test_provider(provider_id: str, config: dict, client: httpx.AsyncClient) -> dict:
     """测试单个 AI 服务商"""
     result = {"id": provider_id, "name": config["name"], "status": "未配置", "message": ""}
     
@@ -61,28 +61,27 @@ async def test_provider(provider_id: str, config: dict) -> dict:
         return result
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{config['base_url']}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {config['api_key']}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": config["model"],
-                    "messages": [{"role": "user", "content": "说'测试成功'三个字"}],
-                    "max_tokens": 50
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                result["status"] = "✅ 可用"
-                result["message"] = content[:50]
-            else:
-                result["status"] = "❌ 失败"
-                result["message"] = f"HTTP {response.status_code}: {response.text[:100]}"
+        response = await client.post(
+            f"{config['base_url']}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {config['api_key']}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": config["model"],
+                "messages": [{"role": "user", "content": "说'测试成功'三个字"}],
+                "max_tokens": 50
+            }
+        )
+        
+        if response.status_code == 200:
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+            result["status"] = "✅ 可用"
+            result["message"] = content[:50]
+        else:
+            result["status"] = "❌ 失败"
+            result["message"] = f"HTTP {response.status_code}: {response.text[:100]}"
     except Exception as e:
         result["status"] = "❌ 错误"
         result["message"] = str(e)[:100]
@@ -94,8 +93,18 @@ async def main():
     print("AI 服务商测试")
     print("=" * 60)
     
-    tasks = [test_provider(pid, cfg) for pid, cfg in PROVIDERS.items()]
-    results = await asyncio.gather(*tasks)
+    # 未配置 API Key 的服务商直接生成结果，不发起请求
+    results = [
+        {"id": pid, "name": cfg["name"], "status": "未配置", "message": "API Key 未配置"}
+        for pid, cfg in PROVIDERS.items() if not cfg["api_key"]
+    ]
+    
+    # 所有服务商共用一个客户端（连接池）
+    configured = [(pid, cfg) for pid, cfg in PROVIDERS.items() if cfg["api_key"]]
+    if configured:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            tasks = [test_provider(pid, cfg, client) for pid, cfg in configured]
+            results += await asyncio.gather(*tasks)
     
     for r in results:
         print(f"\n【{r['name']}】 {r['status']}")
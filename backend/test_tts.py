@@ -9,6 +9,14 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from app.core.model_manager import get_model_manager
 
+# 候选参考音频文件名，按优先级排列（先按扩展名，再按文件名）
+_CANDIDATES = tuple(
+    f"{name}{ext}"
+    for ext in ('.wav', '.mp3', '.m4a')
+    for name in ('test', 'sample', 'reference', 'speaker')
+)
+_CANDIDATE_SET = frozenset(_CANDIDATES)
+
 def test_tts():
     print("=" * 50)
     print("TTS 模型测试")
@@ -26,15 +34,10 @@ def test_tts():
     
     # 检查是否有参考音频
     # 需要一个参考音频文件来克隆声音
-    test_audio = None
-    for ext in ['.wav', '.mp3', '.m4a']:
-        for name in ['test', 'sample', 'reference', 'speaker']:
-            path = f"{name}{ext}"
-            if os.path.exists(path):
-                test_audio = path
-                break
-        if test_audio:
-            break
+    # 只读取一次当前目录，代替逐个 os.path.exists
+    with os.scandir(".") as entries:
+        found = {entry.name for entry in entries if entry.name in _CANDIDATE_SET and entry.is_file()}
+    test_audio = next((name for name in _CANDIDATES if name in found), None)
     
     if not test_audio:
         print("\n⚠️  没有找到参考音频文件")
@@ -3,6 +3,7 @@
 
 使用 hypothesis 进行属性测试，验证视频配置和尺寸计算的正确性。
 """
+import itertools
 import os
 import tempfile
 import pytest
@@ -26,6 +27,9 @@ from app.services.video_service import (
     validate_transition_duration,
     validate_transition_type,
     get_transition_config,
+    apply_wipe_transition,
+    apply_fade_transition,
+    apply_transitions_to_clips,
 )
 
 
@@ -40,11 +44,10 @@ settings.load_profile("ci")
 # **Validates: Requirements 5.1, 5.2**
 # ============================================================
 
-@given(
-    resolution=st.sampled_from(list(VIDEO_RESOLUTIONS.keys())),
-    layout=st.sampled_from(list(VIDEO_LAYOUTS.keys()))
+@pytest.mark.parametrize(
+    "resolution,layout",
+    list(itertools.product(VIDEO_RESOLUTIONS, VIDEO_LAYOUTS))
 )
-@settings(max_examples=20)
 def test_video_size_calculation_correctness(resolution: str, layout: str):
     """
     Property 1: 视频尺寸计算正确性
@@ -84,8 +87,7 @@ def test_video_size_calculation_correctness(resolution: str, layout: str):
 # **Validates: Requirements 5.4, 5.5**
 # ============================================================
 
-@given(platform=st.sampled_from(list(PLATFORM_PRESETS.keys())))
-@settings(max_examples=20)
+@pytest.mark.parametrize("platform", list(PLATFORM_PRESETS.keys()))
 def test_platform_preset_completeness(platform: str):
     """
     Property 2: 平台预设配置完整性
@@ -208,8 +210,7 @@ def test_media_adaptation_correctness(
         source_clip.close()
 
 
-@given(fit_mode=st.sampled_from(list(FIT_MODES.keys())))
-@settings(max_examples=20)
+@pytest.mark.parametrize("fit_mode", list(FIT_MODES.keys()))
 def test_media_adaptation_preserves_aspect_ratio_in_fit_mode(fit_mode: str):
     """
     验证 fit 模式下素材保持原始比例
@@ -260,6 +261,25 @@ def test_adapt_media_invalid_fit_mode():
         source_clip.close()
 
 
+def test_adapt_media_same_size_returns_clip():
+    """
+    验证素材已是目标尺寸时各适配模式直接返回原片段
+    
+    **Validates: Requirements 6.1**
+    """
+    source_clip = ColorClip(
+        size=(1280, 720),
+        color=(100, 100, 100),
+        duration=1.0
+    )
+    
+    try:
+        for fit_mode in ["crop", "fit", "stretch"]:
+            assert adapt_media_to_size(source_clip, (1280, 720), fit_mode) is source_clip
+    finally:
+        source_clip.close()
+
+
 # ============================================================
 # Property 10: 转场时长配置验证
 # **Feature: video-remix, Property 10: 转场时长配置验证**
@@ -339,8 +359,7 @@ def test_transition_duration_validation_too_long(duration: float):
     assert "转场时长必须在" in str(exc_info.value)
 
 
-@given(transition_type=st.sampled_from(list(TRANSITIONS.keys())))
-@settings(max_examples=20)
+@pytest.mark.parametrize("transition_type", list(TRANSITIONS.keys()))
 def test_transition_type_validation_valid(transition_type: str):
     """
     Property 10: 转场类型验证 - 有效类型
@@ -366,6 +385,55 @@ def test_transition_type_validation_invalid():
     assert "无效的转场类型" in str(exc_info.value)
 
 
+@pytest.mark.parametrize("direction", ["left", "right"])
+def test_wipe_transition_splits_frame(direction: str):
+    """
+    验证擦除转场在转场中点时画面一半来自前一片段、一半来自后一片段
+    
+    **Validates: Requirements 6.4**
+    """
+    clip1 = ColorClip(size=(100, 20), color=(255, 0, 0), duration=2.0).set_fps(10)
+    clip2 = ColorClip(size=(100, 20), color=(0, 0, 255), duration=2.0).set_fps(10)
+    
+    result = apply_wipe_transition(clip1, clip2, direction, duration=1.0)
+    assert result.duration == pytest.approx(3.0)
+    
+    frame = result.get_frame(1.5)
+    first, second = (frame[0, 10], frame[0, 90]) if direction == "left" else (frame[0, 90], frame[0, 10])
+    assert tuple(first) == (255, 0, 0), "分界线一侧应保留前一片段"
+    assert tuple(second) == (0, 0, 255), "分界线另一侧应显示后一片段"
+    
+    assert tuple(result.get_frame(0.5)[0, 50]) == (255, 0, 0)
+    assert tuple(result.get_frame(2.5)[0, 50]) == (0, 0, 255)
+
+
+@pytest.mark.parametrize("durations", [(2.0, 2.0, 2.0), (2.0, 1.5, 2.0), (2.0, 0.8, 2.0), (0.6, 2.0, 0.4)])
+def test_crossfade_timeline_matches_pairwise(durations):
+    """
+    验证多片段淡入淡出合成到同一时间线后，与逐对合成的时长和画面一致
+    （包括中间片段短于两侧转场之和的情况）
+    
+    **Validates: Requirements 6.2**
+    """
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    
+    def make_clips():
+        return [
+            ColorClip(size=(8, 8), color=color, duration=d).set_fps(10)
+            for color, d in zip(colors, durations)
+        ]
+    
+    pairwise = make_clips()[0]
+    for clip in make_clips()[1:]:
+        pairwise = apply_fade_transition(pairwise, clip, 1.0)
+    
+    result = apply_transitions_to_clips(make_clips(), "fade", 1.0)
+    assert result.duration == pytest.approx(pairwise.duration)
+    
+    for t in [i * 0.1 for i in range(int(pairwise.duration * 10))]:
+        assert abs(result.get_frame(t).astype(int) - pairwise.get_frame(t).astype(int)).max() <= 1, f"t={t:.1f} 画面不一致"
+
+
 @given(
     transition_type=st.sampled_from(list(TRANSITIONS.keys())),
     duration=st.floats(
@@ -686,8 +754,7 @@ def test_video_adjustments_validation_combined(
     assert result[2] == saturation, f"饱和度验证失败: {saturation}"
 
 
-@given(filter_type=st.sampled_from(list(COLOR_FILTERS.keys())))
-@settings(max_examples=20)
+@pytest.mark.parametrize("filter_type", list(COLOR_FILTERS.keys()))
 def test_color_filter_validation_valid(filter_type: str):
     """
     Property 19: 颜色滤镜类型验证 - 有效类型
@@ -713,8 +780,7 @@ def test_color_filter_validation_invalid():
     assert "无效的滤镜类型" in str(exc_info.value)
 
 
-@given(effect_type=st.sampled_from(list(EFFECT_TYPES.keys())))
-@settings(max_examples=20)
+@pytest.mark.parametrize("effect_type", list(EFFECT_TYPES.keys()))
 def test_effect_type_validation_valid(effect_type: str):
     """
     Property 19: 特效类型验证 - 有效类型
@@ -798,8 +864,7 @@ def test_apply_video_adjustments_preserves_size(
         source_clip.close()
 
 
-@given(filter_type=st.sampled_from(list(COLOR_FILTERS.keys())))
-@settings(max_examples=20)
+@pytest.mark.parametrize("filter_type", list(COLOR_FILTERS.keys()))
 def test_apply_color_filter_preserves_size(filter_type: str):
     """
     Property 19: 颜色滤镜保持尺寸
@@ -1117,6 +1182,45 @@ def test_audio_mixing_parameters_validation(
     assert result is None, "当没有音频输入时，应返回 None"
 
 
+def test_audio_mixing_muted_bgm_is_skipped():
+    """
+    Property 11: 音频轨道合成 - 静音 BGM
+    
+    BGM 音量为 0 时不参与混合，直接返回配音。
+    
+    **Validates: Requirements 6.6, 6.7**
+    """
+    from moviepy.editor import AudioClip
+    
+    voice = AudioClip(lambda t: 0 * t, duration=2.0, fps=8000)
+    bgm = AudioClip(lambda t: 0 * t, duration=1.0, fps=8000)
+    
+    result = mix_audio_tracks(voice_audio=voice, bgm_audio=bgm, bgm_volume=0.0)
+    
+    assert result is voice
+
+
+def test_audio_mixing_short_tracks_are_summed():
+    """
+    Property 11: 音频轨道合成 - 短音频直接相加
+    
+    配音与循环后的 BGM 按采样相加，时长与配音一致。
+    
+    **Validates: Requirements 6.6, 6.7**
+    """
+    import numpy as np
+    from moviepy.editor import AudioClip
+    
+    voice = AudioClip(lambda t: np.full((np.size(t), 2), 0.2), duration=2.0, fps=44100)
+    bgm = AudioClip(lambda t: np.full((np.size(t), 2), 0.4), duration=0.5, fps=44100)
+    
+    result = mix_audio_tracks(voice_audio=voice, bgm_audio=bgm, bgm_volume=0.5)
+    
+    assert result.duration == pytest.approx(2.0)
+    samples = result.get_frame(np.array([0.0, 0.75, 1.9]))
+    assert np.allclose(samples, 0.4)
+
+
 # ============================================================
 # Property 18: 配置参数验证
 # **Feature: video-remix, Property 18: 配置参数验证**
@@ -1397,8 +1501,7 @@ def test_config_params_validation_valid(
     assert result["output_quality"] == output_quality
 
 
-@given(platform_preset=st.sampled_from(list(PLATFORM_PRESETS.keys())))
-@settings(max_examples=20)
+@pytest.mark.parametrize("platform_preset", list(PLATFORM_PRESETS.keys()))
 def test_config_params_validation_with_platform_preset(platform_preset: str):
     """
     Property 18: 配置参数验证 - 平台预设验证
@@ -2059,8 +2162,7 @@ def test_output_video_format_with_all_features():
             os.remove(output_path)
 
 
-@given(output_quality=st.sampled_from(["low", "medium", "high", "ultra"]))
-@settings(max_examples=4, deadline=None)
+@pytest.mark.parametrize("output_quality", ["low", "medium", "high", "ultra"])
 def test_output_video_format_with_different_quality(output_quality: str):
     """
     Property 12: 输出视频格式验证 - 不同质量设置
@@ -2103,6 +2205,82 @@ def test_output_video_format_with_different_quality(output_quality: str):
             os.remove(output_path)
 
 
+@pytest.mark.parametrize("transition_enabled", [False, True])
+def test_create_video_segments_from_one_source_in_parallel(monkeypatch, tmp_path, transition_enabled: bool):
+    """
+    Property 12: 输出视频格式验证 - 同一视频素材的多个片段并行构建
+    
+    多个片段截取自同一个视频文件时，并行构建片段不应争用同一个读取器，
+    每个片段的画面应来自其截取位置。
+    
+    **Validates: Requirements 6.3, 6.9**
+    """
+    import numpy as np
+    from moviepy.editor import VideoClip, VideoFileClip
+    import app.services.video_service as video_service
+    
+    # 素材亮度随时间变化（每秒 +50），用于检查片段截取位置
+    source_path = str(tmp_path / "source.mp4")
+    source = VideoClip(lambda t: np.full((48, 64, 3), int(t * 50), dtype=np.uint8), duration=4.0)
+    source.write_videofile(source_path, fps=24, codec="libx264", audio=False, verbose=False, logger=None)
+    
+    # 强制使用多个线程构建片段
+    monkeypatch.setattr(video_service.os, "cpu_count", lambda: 8)
+    
+    output_path = str(tmp_path / "output.mp4")
+    create_video_from_config({
+        "script": "一。二。三。四。五。六。",
+        "video_resolution": "480p",
+        "video_layout": "16:9",
+        "video_fps": 24,
+        "media_files": [source_path],
+        "clip_min_duration": 1.0,
+        "clip_max_duration": 1.0,
+        "transition_enabled": transition_enabled,
+        "transition_type": "fade",
+        "transition_duration": 0.3,
+        "subtitle_enabled": False,
+        "output_path": output_path,
+    })
+    
+    with VideoFileClip(output_path) as output:
+        step = 0.7 if transition_enabled else 1.0
+        assert output.duration == pytest.approx(5 * step + 1.0, abs=0.1)
+        # 第 i 个片段截取自素材的 (i % 3) 秒处，检查片段中间无转场重叠的帧
+        for i in range(6):
+            local_t = 0.5
+            expected = ((i % 3) + local_t) * 50
+            frame = output.get_frame(i * step + local_t)
+            assert abs(float(frame.mean()) - expected) < 8, f"片段 {i} 画面不正确"
+
+
+def test_text_clip_cache_is_scoped_to_caller(monkeypatch):
+    """
+    验证字幕渲染缓存只在调用方传入的字典内复用，不在进程内保留
+    
+    **Validates: Requirements 6.9**
+    """
+    import moviepy.editor
+    from app.services.video_service import create_text_clip
+    
+    rendered = []
+    
+    def fake_text_clip(text, **kwargs):
+        rendered.append(text)
+        return ColorClip(size=(kwargs["size"][0], 20), color=(255, 255, 255))
+    
+    monkeypatch.setattr(moviepy.editor, "TextClip", fake_text_clip)
+    
+    text_cache = {}
+    for sentence in ["一", "二", "一", "二"]:
+        create_text_clip(sentence, 1.0, (320, 240), text_cache=text_cache)
+    assert rendered == ["一", "二"], "同一次生成内相同字幕只渲染一次"
+    
+    create_text_clip("一", 1.0, (320, 240))
+    create_text_clip("一", 1.0, (320, 240))
+    assert rendered == ["一", "二", "一", "一"], "未传入缓存时不应复用"
+
+
 # ============================================================
 # Property 3: 媒体文件格式验证
 # **Feature: video-remix, Property 3: 媒体文件格式验证**
@@ -2121,6 +2299,7 @@ from app.services.video_service import (
     validate_image_file_size,
     validate_media_file_size,
     validate_media_file,
+    validate_media_files,
 )
 
 
@@ -2636,13 +2815,58 @@ def test_validate_media_file_oversized_image():
         os.remove(tmp_path)
 
 
+def test_validate_media_files_batch():
+    """
+    Property 4: 文件大小限制验证 - 目录批量验证
+    
+    验证 validate_media_files 单次遍历目录，结果与 validate_media_file 一致。
+    
+    **Validates: Requirements 3.1, 3.2, 3.3, 3.4**
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        contents = {
+            "a.mp4": b'0' * 1024,
+            "b.jpg": b'0' * 2048,
+            "c.txt": b'0' * 16,
+        }
+        for name, data in contents.items():
+            with open(os.path.join(tmp_dir, name), "wb") as f:
+                f.write(data)
+        os.makedirs(os.path.join(tmp_dir, "sub.mp4"))
+        
+        results = validate_media_files(tmp_dir)
+        
+        # 子目录不计入结果，结果按路径排序
+        assert [r["filename"] for r in results] == ["a.mp4", "b.jpg", "c.txt"]
+        
+        for r in results:
+            expected = validate_media_file(r["path"])
+            for key, value in expected.items():
+                assert r[key] == value, f"{r['filename']} 字段 {key} 不一致"
+
+
+def test_validate_media_files_dir_not_found():
+    """
+    Property 4: 文件大小限制验证 - 目录不存在
+    
+    **Validates: Requirements 3.3, 3.4**
+    """
+    with pytest.raises(FileNotFoundError):
+        validate_media_files("/nonexistent/path/dir")
+
+
 # ============================================================
 # Property 5: 视频信息提取完整性
 # **Feature: video-remix, Property 5: 视频信息提取完整性**
 # **Validates: Requirements 3.5**
 # ============================================================
 
-from app.services.video_service import get_video_info, VideoInfoError
+from app.services.video_service import (
+    get_video_info,
+    VideoInfoError,
+    _parse_frame_rate,
+    _probe_video_with_ffprobe,
+)
 
 
 # 定义合理的视频尺寸和帧率策略
@@ -2839,6 +3063,91 @@ def test_video_info_extraction_returns_correct_types():
             os.remove(tmp_path)
 
 
+@pytest.mark.parametrize("rate,expected", [
+    ("30000/1001", 30000 / 1001),
+    ("25/1", 25.0),
+    ("24", 24.0),
+    ("0/0", None),
+    ("0/1", None),
+    ("", None),
+    (None, None),
+    ("abc/1", None),
+])
+def test_parse_frame_rate(rate, expected):
+    """
+    验证 ffprobe 帧率字符串解析，无效或为 0 的帧率返回 None
+    
+    **Validates: Requirements 3.5**
+    """
+    result = _parse_frame_rate(rate)
+    if expected is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected)
+
+
+def _fake_ffprobe_run(payload, returncode=0):
+    """返回一个模拟 ffprobe 输出 JSON 的 subprocess.run"""
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, returncode, stdout=json.dumps(payload), stderr="ffprobe error")
+    return fake_run
+
+
+@pytest.mark.parametrize("stream_extra,expected_size", [
+    ({}, (1920, 1080)),
+    ({"tags": {"rotate": "90"}}, (1080, 1920)),
+    ({"tags": {"rotate": "180"}}, (1920, 1080)),
+    ({"side_data_list": [{"side_data_type": "Display Matrix", "rotation": -90}]}, (1080, 1920)),
+    ({"tags": {"rotate": "0"}, "side_data_list": [{"rotation": -90}]}, (1920, 1080)),
+])
+def test_probe_video_with_ffprobe(monkeypatch, stream_extra, expected_size):
+    """
+    验证 ffprobe JSON 输出的解析：帧率、时长，以及旋转标签 / side_data_list 的宽高交换
+    
+    **Validates: Requirements 3.5**
+    """
+    import app.services.video_service as video_service
+    
+    payload = {
+        "streams": [
+            {"codec_type": "audio", "duration": "9.0"},
+            {
+                "codec_type": "video", "width": 1920, "height": 1080,
+                "avg_frame_rate": "0/0", "r_frame_rate": "30000/1001",
+                "duration": "9.5", **stream_extra,
+            },
+        ],
+        "format": {"duration": "10.000000"},
+    }
+    monkeypatch.setattr(video_service.subprocess, "run", _fake_ffprobe_run(payload))
+    
+    duration, width, height, fps = _probe_video_with_ffprobe("ffprobe", "in.mp4")
+    assert duration == 10.0
+    assert (width, height) == expected_size
+    assert fps == pytest.approx(30000 / 1001)
+
+
+def test_probe_video_with_ffprobe_errors(monkeypatch):
+    """
+    验证缺少视频流或 ffprobe 执行失败时抛出 VideoInfoError
+    
+    **Validates: Requirements 3.5**
+    """
+    import app.services.video_service as video_service
+    
+    monkeypatch.setattr(
+        video_service.subprocess, "run",
+        _fake_ffprobe_run({"streams": [{"codec_type": "audio"}], "format": {"duration": "3.0"}}),
+    )
+    with pytest.raises(VideoInfoError) as exc_info:
+        _probe_video_with_ffprobe("ffprobe", "in.mp3")
+    assert "未找到视频流" in str(exc_info.value)
+    
+    monkeypatch.setattr(video_service.subprocess, "run", _fake_ffprobe_run({}, returncode=1))
+    with pytest.raises(VideoInfoError):
+        _probe_video_with_ffprobe("ffprobe", "in.mp4")
+
+
 # ============================================================
 # Property 6: 视频裁剪时间验证
 # **Feature: video-remix, Property 6: 视频裁剪时间验证**
@@ -2849,6 +3158,8 @@ from app.services.video_service import (
     validate_trim_time_range,
     trim_video,
     VideoTrimError,
+    _find_keyframe_before,
+    _trim_stream_copy,
 )
 
 
@@ -3115,6 +3426,103 @@ def test_trim_video_invalid_format():
         os.remove(tmp_path)
 
 
+def test_find_keyframe_before(monkeypatch):
+    """
+    验证从 ffprobe 输出中选取不晚于开始时间的最近关键帧，ffprobe 失败时返回 None
+    
+    **Validates: Requirements 4.5**
+    """
+    import app.services.video_service as video_service
+    
+    calls = []
+    
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="0.000000,\n2.000000\n\n4.050000\nN/A\n", stderr="")
+    
+    monkeypatch.setattr(video_service.subprocess, "run", fake_run)
+    assert _find_keyframe_before("ffprobe", "in.mp4", 3.0) == 2.0
+    assert _find_keyframe_before("ffprobe", "in.mp4", 2.0) == 2.0
+    assert _find_keyframe_before("ffprobe", "in.mp4", 1.99) == 0.0
+    assert "%3.100" in calls[0], "只应读取到开始时间加容差为止"
+    
+    monkeypatch.setattr(
+        video_service.subprocess, "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, stdout="5.000000\n", stderr=""),
+    )
+    assert _find_keyframe_before("ffprobe", "in.mp4", 3.0) is None
+    
+    monkeypatch.setattr(
+        video_service.subprocess, "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, stdout="", stderr="error"),
+    )
+    assert _find_keyframe_before("ffprobe", "in.mp4", 3.0) is None
+
+
+def test_trim_stream_copy(monkeypatch):
+    """
+    验证流复制裁剪的 ffmpeg 参数，以及 ffmpeg 失败时抛出 VideoTrimError
+    
+    **Validates: Requirements 4.3**
+    """
+    import app.services.video_service as video_service
+    
+    calls = []
+    
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+    
+    monkeypatch.setattr(video_service.subprocess, "run", fake_run)
+    _trim_stream_copy("in.mp4", "out.mp4", 2.0, 3.5)
+    cmd = calls[0]
+    assert cmd[cmd.index("-ss") + 1] == "2.000"
+    assert cmd[cmd.index("-t") + 1] == "1.500"
+    assert cmd[cmd.index("-c") + 1] == "copy"
+    assert cmd[-1] == "out.mp4"
+    
+    monkeypatch.setattr(
+        video_service.subprocess, "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, stdout="", stderr="codec not supported"),
+    )
+    with pytest.raises(VideoTrimError) as exc_info:
+        _trim_stream_copy("in.mp4", "out.mp4", 2.0, 3.5)
+    assert "codec not supported" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("output_name", ["output.mp4", "output.mkv"])
+def test_trim_video_falls_back_to_encoding(monkeypatch, tmp_path, output_name: str):
+    """
+    验证流复制失败或输出容器与输入不同时，trim_video 改为重新编码
+    
+    **Validates: Requirements 4.3, 4.5**
+    """
+    import app.services.video_service as video_service
+    
+    input_path = str(tmp_path / "input.mp4")
+    clip = ColorClip(size=(64, 48), color=(100, 100, 100), duration=3.0).set_fps(24)
+    clip.write_videofile(input_path, codec="libx264", audio=False, fps=24, verbose=False, logger=None)
+    clip.close()
+    
+    copies = []
+    
+    def failing_stream_copy(*args):
+        copies.append(args)
+        raise VideoTrimError("流复制裁剪失败")
+    
+    monkeypatch.setattr(video_service, "_find_ffprobe", lambda: "ffprobe")
+    monkeypatch.setattr(video_service, "get_video_info", lambda path: {"duration": 3.0})
+    monkeypatch.setattr(video_service, "_find_keyframe_before", lambda ffprobe, path, time: 0.0)
+    monkeypatch.setattr(video_service, "_trim_stream_copy", failing_stream_copy)
+    
+    output_path = str(tmp_path / output_name)
+    result = trim_video(input_path, output_path, 0.0, 1.0)
+    
+    assert len(copies) == (1 if output_name.endswith(".mp4") else 0)
+    assert os.path.getsize(output_path) > 0
+    assert result["actual_duration"] == pytest.approx(1.0, abs=0.1)
+
+
 # ============================================================
 # Property 14: 任务 ID 唯一性
 # **Feature: video-remix, Property 14: 任务 ID 唯一性**
@@ -3133,6 +3541,7 @@ from app.services.video_service import (
     get_task_status_name,
     TaskStatusResponse,
     build_task_status_response,
+    build_task_status_dict,
     validate_task_status_response,
 )
 
@@ -3226,6 +3635,11 @@ def test_is_valid_uuid_invalid_inputs():
     assert not is_valid_uuid("not-a-uuid")
     assert not is_valid_uuid("12345678-1234-1234-1234-123456789012")  # 不是 v4
     assert not is_valid_uuid("12345678-1234-5234-1234-123456789012")  # v5 不是 v4
+    
+    # 长度错误（含首尾多余字符）
+    assert not is_valid_uuid("550e8400-e29b-41d4-a716-44665544000")
+    assert not is_valid_uuid("550e8400-e29b-41d4-a716-446655440000\n")
+    assert not is_valid_uuid_format("550e8400-e29b-41d4-a716-446655440000\n")
 
 
 def test_is_valid_uuid_format_valid_inputs():
@@ -3433,6 +3847,39 @@ def test_task_status_processing_response():
     assert "error_message" not in result
 
 
+@given(
+    status_code=st.integers(min_value=0, max_value=4),
+    progress=st.integers(min_value=-10, max_value=110),
+    progress_message=st.one_of(st.none(), st.just(""), st.text(min_size=1, max_size=10)),
+    task_id=st.one_of(st.none(), st.uuids().map(str)),
+)
+@settings(max_examples=50)
+def test_build_task_status_dict_matches_response(
+    status_code: int,
+    progress: int,
+    progress_message,
+    task_id,
+):
+    """
+    Property 15: 任务状态查询完整性 - 直接构建字典
+    
+    build_task_status_dict 的结果应与 build_task_status_response(...).to_dict() 完全相同。
+    
+    **Validates: Requirements 8.3, 8.5, 8.6**
+    """
+    kwargs = dict(
+        status_code=status_code,
+        progress=progress,
+        progress_message=progress_message,
+        error_message="内存不足",
+        download_url="http://example.com/video.mp4",
+        duration=12.5,
+        task_id=task_id,
+    )
+    
+    assert build_task_status_dict(**kwargs) == build_task_status_response(**kwargs).to_dict()
+
+
 def test_validate_task_status_response_valid():
     """
     Property 15: 任务状态响应验证 - 有效响应
@@ -3534,6 +3981,7 @@ def test_get_task_status_name():
 from app.services.video_service import (
     validate_config_defaults,
     get_config_with_defaults,
+    RenderConfig,
     get_all_config_defaults,
     get_config_ranges,
     get_config_options,
@@ -3628,6 +4076,20 @@ def test_validate_config_defaults_all_valid():
         assert key in defaults, f"默认值字典应该包含 {key}"
 
 
+def test_validate_config_defaults_fast_fail():
+    """
+    Property 17: 配置默认值有效性 - fast_fail 模式
+    
+    默认值全部有效时，fast_fail 模式应返回与普通模式相同的结果。
+    
+    **Validates: Requirements 9.2, 9.3**
+    """
+    result = validate_config_defaults(fast_fail=True)
+    
+    assert result["valid"] is True
+    assert result["defaults"] == validate_config_defaults()["defaults"]
+
+
 def test_brightness_default_in_range():
     """
     Property 17: 配置默认值有效性 - 亮度默认值
@@ -4102,3 +4564,55 @@ def test_get_config_options():
         assert key in options, f"选项字典应该包含 {key}"
         assert isinstance(options[key], list), f"{key} 应该是列表"
         assert len(options[key]) > 0, f"{key} 应该有至少一个选项"
+
+
+def test_render_config_from_request_defaults():
+    """
+    Property 17: 配置默认值有效性 - 渲染配置默认值
+    
+    验证空配置解析出的 RenderConfig 使用系统默认值。
+    
+    **Validates: Requirements 9.2, 9.3**
+    """
+    cfg = RenderConfig.from_request({})
+    
+    assert cfg.size == calculate_video_size(VIDEO_RESOLUTION_DEFAULT, VIDEO_LAYOUT_DEFAULT)
+    assert cfg.fps == VIDEO_FPS_DEFAULT
+    assert cfg.fit_mode == FIT_MODE_DEFAULT
+    assert cfg.transition_type == TRANSITION_TYPE_DEFAULT
+    assert cfg.brightness == BRIGHTNESS_DEFAULT
+    assert cfg.clip_min_duration == CLIP_MIN_DURATION_DEFAULT
+    assert cfg.clip_max_duration == CLIP_MAX_DURATION_DEFAULT
+    assert cfg.subtitle_size == SUBTITLE_SIZE_DEFAULT
+    assert cfg.subtitle_position == SUBTITLE_POSITION_DEFAULT
+    assert cfg.output_quality == OUTPUT_QUALITY_DEFAULT
+    assert cfg == RenderConfig(), "解析空配置应与字段默认值一致"
+
+
+def test_render_config_from_request_normalizes_invalid_values():
+    """
+    Property 17: 配置默认值有效性 - 渲染配置校验
+    
+    验证无效的枚举值回退到默认值，超出范围的数值被限制在有效范围内。
+    
+    **Validates: Requirements 9.2, 9.3**
+    """
+    cfg = RenderConfig.from_request({
+        "platform_preset": "bilibili",
+        "fit_mode": "unknown",
+        "transition_type": "unknown",
+        "color_filter": "unknown",
+        "brightness": 100,
+        "bgm_volume": -1,
+        "subtitle_config": {"position": "unknown"},
+        "output_quality": "unknown",
+    })
+    
+    assert cfg.size == calculate_video_size("1080p", "16:9")
+    assert cfg.fit_mode == "crop"
+    assert cfg.transition_type == "fade"
+    assert cfg.color_filter == "none"
+    assert cfg.brightness == BRIGHTNESS_MAX
+    assert cfg.bgm_volume == BGM_VOLUME_MIN
+    assert cfg.subtitle_position == SUBTITLE_POSITION_DEFAULT
+    assert cfg.output_quality == OUTPUT_QUALITY_DEFAULT